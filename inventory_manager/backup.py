@@ -1,10 +1,12 @@
+import heapq
 import logging
 import os
 import sqlite3
+import sys
 import threading
 from datetime import datetime
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
 from PyQt6 import QtCore
 
@@ -13,39 +15,155 @@ from .config import BackupConfig
 logger = logging.getLogger(__name__)
 
 
-def backup_database(db_path: Path, backup_dir: Path) -> Path:
+def open_source_connection(db_path: Path) -> sqlite3.Connection:
+    """
+    Open a read-only connection to the live database for use as a backup source.
+    """
+    return sqlite3.connect(
+        f"file:{db_path}?mode=ro", uri=True, check_same_thread=False
+    )
+
+
+def _fast_copy_backup(db_path: Path, backup_path: Path) -> bool:
+    """
+    Copy the database file in kernel space via os.copy_file_range (Linux).
+
+    Only legal while writers are excluded: BEGIN IMMEDIATE is held on a
+    quiesce connection for the whole copy (writers wait on their
+    busy_timeout for the few ms it takes), and the WAL must be fully
+    checkpointed into the main file first. Any other situation — non-WAL
+    journal mode, an active writer, a reader pinning WAL frames — returns
+    False so the caller falls back to the SQLite backup API.
+    """
+    if sys.platform != "linux" or not hasattr(os, "copy_file_range"):
+        return False
+    try:
+        quiesce = sqlite3.connect(str(db_path))
+        try:
+            mode = quiesce.execute("PRAGMA journal_mode").fetchone()[0]
+            if str(mode).lower() != "wal":
+                # In rollback modes wal_checkpoint is a no-op that still
+                # reports not-busy, and commits rewrite the main file
+                # directly; the copy would race them.
+                return False
+            # Take and hold the write lock so no commit (or the
+            # auto-checkpoint that follows one) can touch the main file
+            # mid-copy. Zero busy timeout: an active writer makes this
+            # raise immediately and we fall back to the backup API rather
+            # than stalling the backup thread.
+            quiesce.execute("PRAGMA busy_timeout = 0")
+            quiesce.execute("BEGIN IMMEDIATE")
+            # The holder of the write lock cannot checkpoint itself; a
+            # second connection backfills the WAL into the main file.
+            # PASSIVE never invokes the busy handler — FULL would wait out
+            # its busy timeout on our own held write lock — and with
+            # writers excluded it backfills just the same; the frame-count
+            # check below catches anything a reader still pins.
+            checkpoint = sqlite3.connect(str(db_path))
+            try:
+                _busy, log_frames, done_frames = checkpoint.execute(
+                    "PRAGMA wal_checkpoint(PASSIVE)"
+                ).fetchone()
+            finally:
+                checkpoint.close()
+            if log_frames != done_frames:
+                # A reader is pinning part of the WAL, so the main file is
+                # incomplete. (The busy flag only says the WAL could not be
+                # reset, which our own write lock guarantees.)
+                return False
+            with open(db_path, "rb") as src_f, open(backup_path, "wb") as dst_f:
+                remaining = os.fstat(src_f.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(
+                        src_f.fileno(), dst_f.fileno(), remaining
+                    )
+                    if copied == 0:
+                        break
+                    remaining -= copied
+        finally:
+            quiesce.close()
+    except (OSError, sqlite3.Error) as exc:
+        logger.debug("Fast copy backup unavailable (%s); using backup API", exc)
+        return False
+    return True
+
+
+def backup_database(
+    db_path: Path,
+    backup_dir: Path,
+    *,
+    pages_per_step: int = 1024,
+    src: Optional[sqlite3.Connection] = None,
+) -> Path:
     """
     Create a consistent backup copy of the SQLite database using the backup API.
+
+    Copies ``pages_per_step`` pages per backup step with no sleep between steps;
+    small step sizes collapse throughput, so keep this in the hundreds or more.
     """
     backup_dir.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     backup_path = backup_dir / f"inventory_{timestamp}.db"
 
-    src = sqlite3.connect(str(db_path))
+    if _fast_copy_backup(db_path, backup_path):
+        logger.info("Backup created at %s (fast copy)", backup_path)
+        return backup_path
+
+    own_src = src is None
+    if src is None:
+        src = open_source_connection(db_path)
     dst = sqlite3.connect(str(backup_path))
-    with dst:
-        src.backup(dst)
-    src.close()
-    dst.close()
+    try:
+        with dst:
+            src.backup(dst, pages=pages_per_step, sleep=0)
+    finally:
+        if own_src:
+            src.close()
+        dst.close()
 
     logger.info("Backup created at %s", backup_path)
     return backup_path
 
 
 def prune_backups(backup_dir: Path, max_backups: int) -> List[Path]:
-    backups = sorted(backup_dir.glob("inventory_*.db"))
     removed: List[Path] = []
-    if max_backups <= 0 or len(backups) <= max_backups:
+    if max_backups <= 0:
+        return removed
+    with os.scandir(backup_dir) as entries:
+        names = [
+            entry.name
+            for entry in entries
+            if entry.name.startswith("inventory_") and entry.name.endswith(".db")
+        ]
+    excess = len(names) - max_backups
+    if excess <= 0:
         return removed
-    for path in backups[:-max_backups]:
+    # Filenames embed a fixed-width timestamp, so the oldest backups are the
+    # lexicographically smallest names; select them without a full sort.
+    for name in heapq.nsmallest(excess, names):
+        path = os.path.join(backup_dir, name)
         try:
-            path.unlink()
-            removed.append(path)
+            os.unlink(path)
+            removed.append(Path(path))
         except OSError as exc:
             logger.warning("Unable to remove old backup %s: %s", path, exc)
     return removed
 
 
+class _BackupJob(QtCore.QRunnable):
+    """
+    Thin QRunnable wrapper so backups run on Qt's global thread pool instead
+    of a freshly spawned Python thread per trigger.
+    """
+
+    def __init__(self, manager: "BackupManager"):
+        super().__init__()
+        self._manager = manager
+
+    def run(self) -> None:
+        self._manager._run_backup()
+
+
 class BackupManager(QtCore.QObject):
     backup_started = QtCore.pyqtSignal()
     backup_finished = QtCore.pyqtSignal(str)
@@ -61,6 +179,7 @@ class BackupManager(QtCore.QObject):
         self.timer.timeout.connect(self._trigger_backup)
         self._lock = threading.Lock()
         self._running = False
+        self._src_conn: Optional[sqlite3.Connection] = None
 
     def start(self) -> None:
         if not self.config.enabled:
@@ -73,6 +192,9 @@ class BackupManager(QtCore.QObject):
 
     def stop(self) -> None:
         self.timer.stop()
+        if self._src_conn is not None:
+            self._src_conn.close()
+            self._src_conn = None
 
     def manual_backup(self) -> None:
         self._trigger_backup()
@@ -84,26 +206,46 @@ class BackupManager(QtCore.QObject):
             return
         self._running = True
         self.backup_started.emit()
-        threading.Thread(target=self._run_backup, daemon=True).start()
+        QtCore.QThreadPool.globalInstance().start(_BackupJob(self))
 
     def _run_backup(self) -> None:
         try:
-            backup_path = backup_database(self.db_path, self.backup_dir)
+            if self._src_conn is None:
+                self._src_conn = open_source_connection(self.db_path)
+            backup_path = backup_database(
+                self.db_path,
+                self.backup_dir,
+                pages_per_step=self.config.pages_per_step,
+                src=self._src_conn,
+            )
             removed = prune_backups(self.backup_dir, self.config.max_backups)
-            QtCore.QTimer.singleShot(
-                0, lambda: self._notify_success(backup_path, removed)
+            removed_str = ", ".join(p.name for p in removed) if removed else "none"
+            QtCore.QMetaObject.invokeMethod(
+                self,
+                "_notify_success",
+                QtCore.Qt.ConnectionType.QueuedConnection,
+                QtCore.Q_ARG(str, str(backup_path)),
+                QtCore.Q_ARG(str, removed_str),
             )
         except Exception as exc:  # pylint: disable=broad-except
             logger.exception("Backup failed: %s", exc)
-            QtCore.QTimer.singleShot(0, lambda: self._notify_failure(str(exc)))
+            QtCore.QMetaObject.invokeMethod(
+                self,
+                "_notify_failure",
+                QtCore.Qt.ConnectionType.QueuedConnection,
+                QtCore.Q_ARG(str, str(exc)),
+            )
         finally:
             self._lock.release()
             self._running = False
 
-    def _notify_success(self, backup_path, removed):
-        removed_str = ", ".join(str(p.name) for p in removed) if removed else "none"
-        logger.info("Backup completed: %s (pruned: %s)", backup_path.name, removed_str)
-        self.backup_finished.emit(str(backup_path))
+    @QtCore.pyqtSlot(str, str)
+    def _notify_success(self, backup_path: str, removed_str: str) -> None:
+        logger.info(
+            "Backup completed: %s (pruned: %s)", Path(backup_path).name, removed_str
+        )
+        self.backup_finished.emit(backup_path)
 
-    def _notify_failure(self, message: str):
+    @QtCore.pyqtSlot(str)
+    def _notify_failure(self, message: str) -> None:
         self.backup_failed.emit(message)
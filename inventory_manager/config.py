@@ -1,14 +1,30 @@
+import copy
 import logging
+import pickle
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # libyaml not compiled in; pure-Python parsing is ~10x slower
+    from yaml import SafeLoader as _YamlLoader
+
+    logging.getLogger(__name__).warning(
+        "libyaml not available; falling back to the pure-Python YAML loader"
+    )
+
 
 @dataclass
 class DatabaseConfig:
     path: str = "./data/inventory.db"
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    cache_size: int = -65536
+    mmap_size: int = 268435456
 
 
 @dataclass
@@ -17,6 +33,7 @@ class BackupConfig:
     interval_seconds: int = 300
     directory: str = "./backups"
     max_backups: int = 3
+    pages_per_step: int = 1024
 
 
 @dataclass
@@ -40,12 +57,19 @@ class AppConfig:
 
 
 DEFAULT_CONFIG: Dict[str, Any] = {
-    "database": {"path": "./data/inventory.db"},
+    "database": {
+        "path": "./data/inventory.db",
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -65536,
+        "mmap_size": 268435456,
+    },
     "backup": {
         "enabled": True,
         "interval_seconds": 300,
         "directory": "./backups",
         "max_backups": 288,
+        "pages_per_step": 1024,
     },
     "logging": {"level": "INFO", "file": "./logs/app.log"},
     "ui": {"theme": "light"},
@@ -53,43 +77,101 @@ DEFAULT_CONFIG: Dict[str, Any] = {
 
 
 def _merge_dicts(defaults: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
-    merged: Dict[str, Any] = {}
-    for key, value in defaults.items():
-        if isinstance(value, dict):
-            override_sub = overrides.get(key, {}) if isinstance(overrides.get(key, {}), dict) else {}
-            merged[key] = _merge_dicts(value, override_sub)
-        else:
-            merged[key] = overrides.get(key, value)
-    # include keys present only in overrides
-    for key, value in overrides.items():
-        if key not in merged:
-            merged[key] = value
+    merged = copy.deepcopy(defaults)
+    stack = [(merged, overrides)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            if isinstance(dst.get(key), dict):
+                if isinstance(value, dict):
+                    stack.append((dst[key], value))
+                # else: a bare section header parses to None (children all
+                # commented out); keep the defaults instead of clobbering
+                # the dict with it.
+            else:
+                dst[key] = value
     return merged
 
 
+# Fixed-width header stored ahead of the pickled config so staleness can be
+# checked by comparing raw bytes without unpickling.
+_CACHE_HEADER_SIZE = 32
+
+
+def _cache_header(stat_result) -> bytes:
+    return f"{stat_result.st_mtime_ns}:{stat_result.st_size}".encode().ljust(
+        _CACHE_HEADER_SIZE
+    )
+
+
+def _read_cached_config(cache_path: Path, header: bytes) -> Optional[Dict[str, Any]]:
+    try:
+        with cache_path.open("rb") as f:
+            if f.read(_CACHE_HEADER_SIZE) != header:
+                return None
+            cached = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+    return cached if isinstance(cached, dict) else None
+
+
+def _write_cached_config(cache_path: Path, header: bytes, merged: Dict[str, Any]) -> None:
+    try:
+        with cache_path.open("wb") as f:
+            f.write(header)
+            pickle.dump(merged, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as exc:
+        logging.debug("Unable to write config cache %s: %s", cache_path, exc)
+
+
 def load_config(path: Path) -> AppConfig:
     """
     Load configuration from YAML, merging with defaults and creating directories.
+
+    A pickled sidecar cache (keyed on the YAML file's mtime and size) skips the
+    YAML parse on repeat startups when the config has not changed, and repeated
+    in-process calls for an unchanged file return a memoized AppConfig.
     """
     cfg_path = Path(path)
-    user_config: Dict[str, Any] = {}
+    try:
+        mtime_ns = cfg_path.stat().st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    return _load_config_cached(str(cfg_path), mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(path_str: str, mtime_ns: int) -> AppConfig:
+    cfg_path = Path(path_str)
+    merged: Optional[Dict[str, Any]] = None
     if cfg_path.exists():
-        with cfg_path.open("r", encoding="utf-8") as f:
-            loaded = yaml.safe_load(f) or {}
-            if not isinstance(loaded, dict):
-                raise ValueError("config.yaml is not a valid mapping")
-            user_config = loaded
+        cache_path = cfg_path.with_suffix(cfg_path.suffix + ".cache")
+        header = _cache_header(cfg_path.stat())
+        merged = _read_cached_config(cache_path, header)
+        if merged is None:
+            with cfg_path.open("r", encoding="utf-8") as f:
+                loaded = yaml.load(f, Loader=_YamlLoader) or {}
+                if not isinstance(loaded, dict):
+                    raise ValueError("config.yaml is not a valid mapping")
+            merged = _merge_dicts(DEFAULT_CONFIG, loaded)
+            _write_cached_config(cache_path, header, merged)
     else:
         logging.warning("Config file %s not found. Using defaults.", cfg_path)
-
-    merged = _merge_dicts(DEFAULT_CONFIG, user_config)
-
-    database_cfg = DatabaseConfig(path=str(Path(merged["database"]["path"]).expanduser()))
+        merged = _merge_dicts(DEFAULT_CONFIG, {})
+
+    database_cfg = DatabaseConfig(
+        path=str(Path(merged["database"]["path"]).expanduser()),
+        journal_mode=str(merged["database"].get("journal_mode", "WAL")).upper(),
+        synchronous=str(merged["database"].get("synchronous", "NORMAL")).upper(),
+        cache_size=int(merged["database"].get("cache_size", -65536)),
+        mmap_size=int(merged["database"].get("mmap_size", 268435456)),
+    )
     backup_cfg = BackupConfig(
         enabled=bool(merged["backup"].get("enabled", True)),
         interval_seconds=int(merged["backup"].get("interval_seconds", 300)),
         directory=str(Path(merged["backup"].get("directory", "./backups")).expanduser()),
         max_backups=int(merged["backup"].get("max_backups", 288)),
+        pages_per_step=int(merged["backup"].get("pages_per_step", 1024)),
     )
     logging_cfg = LoggingConfig(
         level=str(merged["logging"].get("level", "INFO")).upper(),
@@ -1,7 +1,7 @@
 import logging
 import sqlite3
+import time
 from contextlib import contextmanager
-from datetime import datetime
 from pathlib import Path
 from typing import Iterator
 
@@ -10,6 +10,9 @@ from .config import AppConfig
 logger = logging.getLogger(__name__)
 
 
+# Bump whenever SCHEMA_SQL changes so existing databases re-run the DDL.
+CURRENT_SCHEMA_VERSION = 3
+
 SCHEMA_SQL = """
 PRAGMA foreign_keys = ON;
 
@@ -33,6 +36,8 @@ CREATE TABLE IF NOT EXISTS Vehicle (
 CREATE INDEX IF NOT EXISTS idx_vehicle_type ON Vehicle (vehicle_type);
 CREATE INDEX IF NOT EXISTS idx_vehicle_number ON Vehicle (vehicle_number);
 CREATE INDEX IF NOT EXISTS idx_vehicle_vin ON Vehicle (vin);
+-- Backs the ORDER BY vehicle_name in list_vehicles/overview_with_counts.
+CREATE INDEX IF NOT EXISTS idx_vehicle_name ON Vehicle (vehicle_name);
 
 CREATE TABLE IF NOT EXISTS Location (
     location_id     TEXT PRIMARY KEY,
@@ -94,11 +99,159 @@ CREATE TABLE IF NOT EXISTS InventoryAudit (
     FOREIGN KEY (from_location_id) REFERENCES Location(location_id),
     FOREIGN KEY (to_location_id) REFERENCES Location(location_id)
 );
+
+-- list_audits_for_asset filters by asset and orders by audit_id DESC; this
+-- serves both without a scan or sort.
+CREATE INDEX IF NOT EXISTS idx_audit_asset ON InventoryAudit (asset_id, audit_id DESC);
+
+-- Full-text index behind the view tab's global search, keyed by
+-- Inventory.rowid. The triggers below keep it in sync; initialize_schema
+-- rebuilds it wholesale on schema bumps.
+CREATE VIRTUAL TABLE IF NOT EXISTS InventorySearch USING fts5(
+    asset_id, location_id, description, manufacturer, model, serial_number,
+    vehicle_name, vehicle_type, side
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_inventory_fts_insert
+AFTER INSERT ON Inventory
+BEGIN
+    INSERT INTO InventorySearch (
+        rowid, asset_id, location_id, description, manufacturer, model,
+        serial_number, vehicle_name, vehicle_type, side
+    )
+    SELECT NEW.rowid, NEW.asset_id, NEW.location_id, NEW.description,
+           NEW.manufacturer, NEW.model, NEW.serial_number,
+           veh.vehicle_name, veh.vehicle_type, loc.side
+    FROM Location AS loc
+    LEFT JOIN Vehicle AS veh ON loc.vehicle_id = veh.vehicle_id
+    WHERE loc.location_id = NEW.location_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_inventory_fts_update
+AFTER UPDATE ON Inventory
+BEGIN
+    DELETE FROM InventorySearch WHERE rowid = OLD.rowid;
+    INSERT INTO InventorySearch (
+        rowid, asset_id, location_id, description, manufacturer, model,
+        serial_number, vehicle_name, vehicle_type, side
+    )
+    SELECT NEW.rowid, NEW.asset_id, NEW.location_id, NEW.description,
+           NEW.manufacturer, NEW.model, NEW.serial_number,
+           veh.vehicle_name, veh.vehicle_type, loc.side
+    FROM Location AS loc
+    LEFT JOIN Vehicle AS veh ON loc.vehicle_id = veh.vehicle_id
+    WHERE loc.location_id = NEW.location_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_inventory_fts_delete
+AFTER DELETE ON Inventory
+BEGIN
+    DELETE FROM InventorySearch WHERE rowid = OLD.rowid;
+END;
+
+-- Side or vehicle changes on a location re-index every item stored there.
+CREATE TRIGGER IF NOT EXISTS trg_location_fts_update
+AFTER UPDATE OF side, vehicle_id ON Location
+BEGIN
+    DELETE FROM InventorySearch WHERE rowid IN (
+        SELECT rowid FROM Inventory
+        WHERE location_id IN (OLD.location_id, NEW.location_id)
+    );
+    INSERT INTO InventorySearch (
+        rowid, asset_id, location_id, description, manufacturer, model,
+        serial_number, vehicle_name, vehicle_type, side
+    )
+    SELECT inv.rowid, inv.asset_id, inv.location_id, inv.description,
+           inv.manufacturer, inv.model, inv.serial_number,
+           veh.vehicle_name, veh.vehicle_type, loc.side
+    FROM Inventory AS inv
+    JOIN Location AS loc ON inv.location_id = loc.location_id
+    LEFT JOIN Vehicle AS veh ON loc.vehicle_id = veh.vehicle_id
+    WHERE inv.location_id IN (OLD.location_id, NEW.location_id);
+END;
+
+-- Renaming or retyping a vehicle re-indexes every item on that vehicle.
+CREATE TRIGGER IF NOT EXISTS trg_vehicle_fts_update
+AFTER UPDATE OF vehicle_name, vehicle_type ON Vehicle
+BEGIN
+    DELETE FROM InventorySearch WHERE rowid IN (
+        SELECT inv.rowid FROM Inventory AS inv
+        JOIN Location AS loc ON inv.location_id = loc.location_id
+        WHERE loc.vehicle_id = NEW.vehicle_id
+    );
+    INSERT INTO InventorySearch (
+        rowid, asset_id, location_id, description, manufacturer, model,
+        serial_number, vehicle_name, vehicle_type, side
+    )
+    SELECT inv.rowid, inv.asset_id, inv.location_id, inv.description,
+           inv.manufacturer, inv.model, inv.serial_number,
+           veh.vehicle_name, veh.vehicle_type, loc.side
+    FROM Inventory AS inv
+    JOIN Location AS loc ON inv.location_id = loc.location_id
+    LEFT JOIN Vehicle AS veh ON loc.vehicle_id = veh.vehicle_id
+    WHERE loc.vehicle_id = NEW.vehicle_id;
+END;
+"""
+
+# Backfills InventorySearch from live rows whenever the schema DDL re-runs.
+SEARCH_REBUILD_SQL = """
+    INSERT INTO InventorySearch (
+        rowid, asset_id, location_id, description, manufacturer, model,
+        serial_number, vehicle_name, vehicle_type, side
+    )
+    SELECT inv.rowid, inv.asset_id, inv.location_id, inv.description,
+           inv.manufacturer, inv.model, inv.serial_number,
+           veh.vehicle_name, veh.vehicle_type, loc.side
+    FROM Inventory AS inv
+    JOIN Location AS loc ON inv.location_id = loc.location_id
+    LEFT JOIN Vehicle AS veh ON loc.vehicle_id = veh.vehicle_id
 """
 
 
 def iso_now() -> str:
-    return datetime.now().replace(microsecond=0).isoformat()
+    # Single C call; matches datetime.now().replace(microsecond=0).isoformat().
+    return time.strftime("%Y-%m-%dT%H:%M:%S")
+
+
+# Connections with an explicit transaction() open; repository writes on one of
+# these defer their commit to it instead of fsyncing per statement.
+_EXPLICIT_TX: set = set()
+
+
+@contextmanager
+def transaction(conn: sqlite3.Connection) -> Iterator[None]:
+    """
+    Group several repository writes into a single commit.
+
+    Re-entrant: a nested call joins the outer transaction instead of
+    committing it early. BEGIN IMMEDIATE takes the write lock up front so the
+    batch cannot deadlock against another writer halfway through.
+    """
+    if id(conn) in _EXPLICIT_TX:
+        yield
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    _EXPLICIT_TX.add(id(conn))
+    try:
+        yield
+    except Exception:
+        conn.rollback()
+        raise
+    else:
+        conn.commit()
+    finally:
+        _EXPLICIT_TX.discard(id(conn))
+
+
+def maybe_commit(conn: sqlite3.Connection) -> None:
+    """
+    Commit unless the caller holds an explicit transaction() on `conn`.
+
+    Keeps the commit-per-call default for single UI operations while bulk
+    callers pay one fsync for the whole batch.
+    """
+    if id(conn) not in _EXPLICIT_TX:
+        conn.commit()
 
 
 class DatabaseManager:
@@ -107,6 +260,7 @@ class DatabaseManager:
     """
 
     def __init__(self, config: AppConfig):
+        self.database_config = config.database
         self.db_path = Path(config.database.path).expanduser()
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self._connection = self._create_connection()
@@ -114,15 +268,39 @@ class DatabaseManager:
         logger.info("Database initialized at %s", self.db_path)
 
     def _create_connection(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self.db_path))
+        # A larger statement cache keeps every repository query prepared;
+        # the default 128 can thrash once the UI, backup and seed paths mix.
+        conn = sqlite3.connect(str(self.db_path), cached_statements=256)
         conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON;")
+        cfg = self.database_config
+        # WAL only applies to on-disk databases; :memory: always journals in
+        # memory and would just ignore the pragma.
+        journal = "MEMORY" if str(self.db_path) == ":memory:" else cfg.journal_mode
+        conn.executescript(
+            f"""
+            PRAGMA journal_mode = {journal};
+            PRAGMA synchronous = {cfg.synchronous};
+            PRAGMA busy_timeout = 30000;
+            PRAGMA temp_store = MEMORY;
+            PRAGMA cache_size = {cfg.cache_size};
+            PRAGMA mmap_size = {cfg.mmap_size};
+            PRAGMA foreign_keys = ON;
+            """
+        )
         return conn
 
     @property
     def connection(self) -> sqlite3.Connection:
         return self._connection
 
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """
+        Batch writes across repositories into one commit; see `transaction`.
+        """
+        with transaction(self._connection):
+            yield
+
     @contextmanager
     def cursor(self) -> Iterator[sqlite3.Cursor]:
         cur = self._connection.cursor()
@@ -136,8 +314,16 @@ class DatabaseManager:
             cur.close()
 
     def initialize_schema(self) -> None:
+        version = self._connection.execute("PRAGMA user_version").fetchone()[0]
+        if version >= CURRENT_SCHEMA_VERSION:
+            return
         with self._connection:
             self._connection.executescript(SCHEMA_SQL)
+            # Databases created before the search index have Inventory rows
+            # but no FTS entries; rebuild it whenever the DDL re-runs.
+            self._connection.execute("DELETE FROM InventorySearch")
+            self._connection.execute(SEARCH_REBUILD_SQL)
+            self._connection.execute(f"PRAGMA user_version = {CURRENT_SCHEMA_VERSION}")
 
     def close(self) -> None:
         if self._connection:
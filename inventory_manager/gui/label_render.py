@@ -0,0 +1,202 @@
+"""
+Shared barcode/QR/label rendering helpers.
+
+The inventory and vehicle panes previously carried verbatim copies of this
+code; keeping one implementation here means the LRU caches are shared across
+panes and optimizations only need to be applied once.
+"""
+import re
+import time
+from datetime import datetime
+from functools import lru_cache
+
+import barcode
+import qrcode
+from barcode.writer import ImageWriter
+from PIL import Image, ImageDraw, ImageFont
+from PyQt6 import QtGui
+
+# Resolved once at import; get_barcode_class walks the barcode registry.
+CODE39 = barcode.get_barcode_class("code39")
+
+# Throwaway draw used only for text measurement before a canvas exists.
+_MEASURE_DRAW = ImageDraw.Draw(Image.new("RGB", (1, 1)))
+
+
+@lru_cache(maxsize=128)
+def render_barcode_raw(code_data: str, options: tuple):
+    """
+    Rasterize a Code39 barcode, memoized by code data and writer options.
+
+    Options are passed as a tuple of sorted (key, value) pairs so the call is
+    hashable; label text is attached afterwards by the caller and is not part
+    of the cache key.
+    """
+    # render() hands back the writer's PIL image directly; write() would
+    # PNG-encode it into a buffer only for us to decode it again.
+    code39 = CODE39(code_data, writer=ImageWriter(), add_checksum=False)
+    return code39.render(dict(options)).convert("RGB")
+
+
+@lru_cache(maxsize=128)
+def render_qr_raw(data: str):
+    """
+    Generate a QR code image, memoized by its encoded data.
+    """
+    box_size = 6
+    # A fixed mask skips the library's scoring pass over all eight mask
+    # patterns (~4x faster here); any mask yields a valid, scannable code.
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_M,
+        box_size=box_size,
+        border=2,
+        mask_pattern=0,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+    # Blit the module matrix at one pixel per module and let a NEAREST
+    # resize scale it up in C, instead of make_image's per-module drawing.
+    # Output is pixel-identical to the PilImage backend.
+    matrix = qr.get_matrix()  # includes the border
+    size = len(matrix)
+    pixels = bytearray()
+    for row in matrix:
+        pixels.extend(0 if module else 255 for module in row)
+    img = Image.frombytes("L", (size, size), bytes(pixels))
+    return img.resize((size * box_size, size * box_size), Image.NEAREST).convert("RGB")
+
+
+@lru_cache(maxsize=32)
+def load_label_font(font_size: int):
+    """
+    Load the label font at the given size, memoized so interactive font-size
+    changes do not re-read and re-parse the TTF from disk per render.
+    """
+    # Use DejaVuSans if available to honor font size changes.
+    try:
+        return ImageFont.truetype(
+            "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", font_size
+        )
+    except Exception:
+        try:
+            return ImageFont.truetype("DejaVuSans.ttf", font_size)
+        except Exception:
+            return ImageFont.load_default()
+
+
+@lru_cache(maxsize=64)
+def render_text_strip(lines: tuple, font_size: int):
+    """
+    Rasterize label lines once onto a transparent strip.
+
+    Rerenders triggered by layout or code-data changes then just paste the
+    cached strip instead of re-running FreeType shaping per line.
+    """
+    font = load_label_font(font_size)
+    # textlength advances glyphs without computing ink boxes; "Ag" spans the
+    # font's ascent and descent.
+    line_height = font.getbbox("Ag")[3]
+    width = int(max(_MEASURE_DRAW.textlength(line, font=font) for line in lines)) or 1
+    height = (line_height + 4) * len(lines)
+    # multiline_text advances lines by bbox("A") height + spacing; solve for
+    # the spacing that reproduces the line_height + 4 advance used for sizing.
+    spacing = line_height + 4 - font.getbbox("A")[3]
+    strip = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+    ImageDraw.Draw(strip).multiline_text(
+        (0, 0), "\n".join(lines), fill="black", font=font, spacing=spacing
+    )
+    return strip
+
+
+def attach_label(base, lines, *, layout: str, font_size: int):
+    """
+    Compose label text lines next to or below a rendered code image.
+    """
+    if not lines:
+        return base
+    strip = render_text_strip(tuple(lines), font_size)
+    padding = 4
+    text_width = strip.width + padding * 2
+
+    if layout == "Right of code":
+        width = base.width + text_width
+        height = max(base.height, strip.height + padding * 2)
+        canvas = Image.new("RGB", (width, height), "white")
+        canvas.paste(base, (0, (height - base.height) // 2))
+        canvas.paste(strip, (base.width + padding, (height - strip.height) // 2), strip)
+    else:  # Below code
+        width = max(base.width, text_width)
+        height = base.height + padding + strip.height
+        canvas = Image.new("RGB", (width, height), "white")
+        canvas.paste(base, ((width - base.width) // 2, 0))
+        canvas.paste(strip, (padding, base.height + padding), strip)
+    return canvas
+
+
+def pil_to_qimage(image) -> QtGui.QImage:
+    # Hand the raw pixel buffer straight to QImage instead of round-tripping
+    # through a PNG encode/decode; grayscale stays single-channel. PyQt keeps
+    # a reference to `data`, so the QImage is safe to pass between threads.
+    width, height = image.size
+    if image.mode in ("1", "L"):
+        if image.mode == "1":
+            image = image.convert("L")
+        data = image.tobytes("raw", "L")
+        return QtGui.QImage(
+            data, width, height, width, QtGui.QImage.Format.Format_Grayscale8
+        )
+    if image.mode != "RGBA":
+        image = image.convert("RGBA")
+    data = image.tobytes("raw", "RGBA")
+    return QtGui.QImage(
+        data, width, height, 4 * width, QtGui.QImage.Format.Format_RGBA8888
+    )
+
+
+def pil_to_pixmap(image) -> QtGui.QPixmap:
+    return QtGui.QPixmap.fromImage(pil_to_qimage(image))
+
+
+def scale_to_fit(image, target_w: int, target_h: int):
+    """
+    Resize a PIL image to fit inside the target box, preserving aspect ratio.
+
+    Mirrors Qt's KeepAspectRatio scaled(); doing it on the PIL side keeps the
+    full-size pixels out of the QImage/QPixmap conversion entirely.
+    """
+    width, height = image.size
+    scale = min(target_w / width, target_h / height)
+    if scale == 1:
+        return image
+    return image.resize(
+        (max(1, round(width * scale)), max(1, round(height * scale))),
+        Image.BILINEAR,
+    )
+
+
+# One C-level pass replaces every character outside the portable filename
+# set, so non-ASCII names no longer fall back to a per-character Python loop.
+_SANITIZE_RE = re.compile(r"[^0-9A-Za-z]")
+
+
+def _sanitize(value: str, limit: int, fallback: str) -> str:
+    return _SANITIZE_RE.sub("_", value)[:limit] or fallback
+
+
+# Timestamp string reused within the same second; strftime is µs-scale but
+# batch saves call it once per file otherwise.
+_LAST_TS: list = [0, ""]
+
+
+def _ts_now() -> str:
+    sec = int(time.time())
+    if sec != _LAST_TS[0]:
+        _LAST_TS[:] = [sec, datetime.now().strftime("%Y%m%d_%H%M%S")]
+    return _LAST_TS[1]
+
+
+def default_filename(name: str, ident: str, fmt: str) -> str:
+    safe_name = _sanitize(name, 40, "label")
+    safe_id = _sanitize(ident, 20, "id")
+    return f"{safe_name}_{safe_id}_{_ts_now()}.{fmt}"
@@ -5,7 +5,7 @@ from pathlib import Path
 from typing import Optional
 
 import barcode
-from barcode.writer import ImageWriter
+from barcode.writer import ImageWriter, SVGWriter
 from PyQt6 import QtCore, QtGui, QtWidgets
 
 from ..repositories import GlobalIdRepository, Location, LocationRepository, VehicleRepository
@@ -13,20 +13,25 @@ from .models import DictTableModel
 
 logger = logging.getLogger(__name__)
 
+# Resolved once at import; get_barcode_class walks the barcode registry.
+CODE39 = barcode.get_barcode_class("code39")
+
 
 def install_copy_shortcut(view: QtWidgets.QTableView) -> None:
     def copy():
         indexes = view.selectionModel().selectedIndexes()
         if not indexes:
             return
-        indexes = sorted(indexes, key=lambda i: (i.row(), i.column()))
         rows = {}
         for idx in indexes:
             rows.setdefault(idx.row(), {})[idx.column()] = idx.data() or ""
-        lines = []
-        for row in sorted(rows):
-            cols = rows[row]
-            lines.append("\t".join(cols.get(c, "") for c in range(max(cols) + 1)))
+        # Compute the selected column span once rather than per row, so sparse
+        # selections do not iterate a dense 0..max(cols) range for each line.
+        all_cols = sorted({col for cols in rows.values() for col in cols})
+        lines = [
+            "\t".join(rows[row].get(col, "") for col in all_cols)
+            for row in sorted(rows)
+        ]
         QtWidgets.QApplication.clipboard().setText("\n".join(lines))
 
     shortcut = QtGui.QShortcut(QtGui.QKeySequence(QtGui.QKeySequence.StandardKey.Copy), view)
@@ -55,6 +60,8 @@ class LocationPane(QtWidgets.QWidget):
         self._default_module_width = 0.15
         self._default_module_height = 8
         self._default_quiet_zone = 1.5
+        self._all_rows: list[dict] = []
+        self._last_term: Optional[str] = None
         self._build_ui()
         self.refresh_table()
 
@@ -68,7 +75,12 @@ class LocationPane(QtWidgets.QWidget):
         )
         self.search_input = QtWidgets.QLineEdit()
         self.search_input.setPlaceholderText("Search any column")
-        self.search_input.textChanged.connect(self._filter_rows)
+        # Debounce keystrokes so bursts collapse into a single filter pass.
+        self._filter_timer = QtCore.QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._filter_rows)
+        self.search_input.textChanged.connect(lambda _: self._filter_timer.start())
 
         self.table = QtWidgets.QTableView()
         self.table.setModel(self.table_model)
@@ -151,22 +163,23 @@ class LocationPane(QtWidgets.QWidget):
         splitter.setStretchFactor(1, 2)
 
     def refresh_table(self) -> None:
-        rows = [asdict(loc) for loc in self.location_repo.list_locations()]
-        self.table_model.set_rows(rows)
+        self._all_rows = self.location_repo.list_locations_dicts()
+        self._last_term = None  # rows changed; force the filter to re-apply
         self._filter_rows()
 
     def _filter_rows(self) -> None:
-        term = self.search_input.text().strip().lower()
+        term = self.search_input.text().strip()
+        if term == self._last_term:
+            return
+        self._last_term = term
         if not term:
-            self.table_model.set_rows(self.table_model._rows)  # type: ignore[attr-defined]
+            # Delta-apply so single-row edits do not reset the whole view.
+            self.table_model.apply_delta(self._all_rows, key="location_id")
             return
-        filtered = [
-            row for row in self.table_model._rows  # type: ignore[attr-defined]
-            if term in str(row.get("location_id", "")).lower()
-            or term in str(row.get("vehicle_id", "")).lower()
-            or term in str(row.get("side", "")).lower()
-        ]
-        self.table_model.set_rows(filtered)
+        # Push the filter into SQLite (LIKE over the indexed columns) instead
+        # of scanning every cached row in Python.
+        matches = self.location_repo.search_locations(term)
+        self.table_model.set_rows([asdict(loc) for loc in matches])
 
     def _clear_form(self) -> None:
         self.current_location_id = None
@@ -279,10 +292,7 @@ class LocationPane(QtWidgets.QWidget):
             path = f"{path}{ext}"
         try:
             if kind == "barcode" and ext == ".svg":
-                from barcode.writer import SVGWriter
-
-                code39_cls = barcode.get_barcode_class("code39")
-                code39 = code39_cls(base_label, writer=SVGWriter(), add_checksum=False)
+                code39 = CODE39(base_label, writer=SVGWriter(), add_checksum=False)
                 code39.save(path, options=self._barcode_writer_options())
             else:
                 fmt_param = "PNG"
@@ -1,12 +1,11 @@
 import logging
-from datetime import datetime
+import sqlite3
 from dataclasses import asdict
-from io import BytesIO
+from io import StringIO
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
-import barcode
-from barcode.writer import ImageWriter
 from PyQt6 import QtCore, QtGui, QtWidgets
 from PyQt6.QtCore import QSettings
 
@@ -21,11 +20,137 @@ from ..repositories import (
     Vehicle,
     VehicleRepository,
 )
+from .label_render import (
+    CODE39,
+    attach_label,
+    default_filename,
+    pil_to_pixmap,
+    pil_to_qimage,
+    render_barcode_raw,
+    render_qr_raw,
+    scale_to_fit,
+)
 from .location_pane import LocationPane
-from .models import DictTableModel, InventoryTableModel, VehicleTableModel
+from .models import (
+    DictTableModel,
+    InventoryTableModel,
+    SearchFilterProxyModel,
+    VehicleTableModel,
+)
 
 logger = logging.getLogger(__name__)
 
+# Flat attribute projection for InventoryItem rows; dataclasses.asdict walks
+# every field through deepcopy, which is wasteful at 500 rows per refresh.
+_INV_FIELDS = (
+    "asset_id",
+    "description",
+    "location_id",
+    "consumable",
+    "manufacturer",
+    "model",
+    "serial_number",
+    "created_at",
+    "updated_at",
+)
+_INV_GET = attrgetter(*_INV_FIELDS)
+
+# Same projection for Vehicle rows.
+_VEH_FIELDS = (
+    "vehicle_id",
+    "vehicle_type",
+    "vehicle_name",
+    "vin",
+    "vehicle_number",
+    "mileage",
+    "last_service",
+    "created_at",
+    "updated_at",
+)
+_VEH_GET = attrgetter(*_VEH_FIELDS)
+
+# Default zlib level for quick label saves; barcode/QR PNGs are tiny and
+# highly compressible, so heavier levels only add encode time.
+LABEL_PNG_COMPRESS_LEVEL = 1
+
+class _CodeRenderSignals(QtCore.QObject):
+    # kind, PIL image, QImage, generation
+    finished = QtCore.pyqtSignal(str, object, object, int)
+    failed = QtCore.pyqtSignal(str, str, int)
+
+
+class _CodeRenderJob(QtCore.QRunnable):
+    """
+    Run one barcode/QR render off the GUI thread and hand back the full-size
+    PIL image (kept for export) plus a preview-sized QImage for display.
+    """
+
+    def __init__(
+        self,
+        kind: str,
+        render_fn,
+        generation: int,
+        signals: _CodeRenderSignals,
+        preview_size: tuple,
+    ):
+        super().__init__()
+        self.kind = kind
+        self.render_fn = render_fn
+        self.generation = generation
+        self.signals = signals
+        self.preview_size = preview_size
+
+    def run(self) -> None:
+        try:
+            image = self.render_fn()
+            # Downscale before the QImage conversion so only preview-sized
+            # pixels cross into Qt; the full image stays PIL-side for export.
+            preview = scale_to_fit(image, *self.preview_size)
+            qimage = pil_to_qimage(preview)
+            self.signals.finished.emit(self.kind, image, qimage, self.generation)
+        except Exception as exc:  # pylint: disable=broad-except
+            self.signals.failed.emit(self.kind, str(exc), self.generation)
+
+
+class _QuerySignals(QtCore.QObject):
+    # rows, total, sequence number
+    loaded = QtCore.pyqtSignal(object, int, int)
+    failed = QtCore.pyqtSignal(str, int)
+
+
+class _QueryJob(QtCore.QRunnable):
+    """
+    Run one repository query off the GUI thread; the sequence number lets the
+    receiving slot drop results that a newer query has already superseded.
+    """
+
+    def __init__(self, query_fn, seq: int, signals: _QuerySignals):
+        super().__init__()
+        self.query_fn = query_fn
+        self.seq = seq
+        self.signals = signals
+
+    def run(self) -> None:
+        try:
+            rows, total = self.query_fn()
+        except Exception as exc:  # pylint: disable=broad-except
+            self.signals.failed.emit(str(exc), self.seq)
+        else:
+            self.signals.loaded.emit(rows, total, self.seq)
+
+
+# Directories already created this process; panes share parents (labels/,
+# exports/), so only the first pane pays the mkdir syscalls per directory.
+_ENSURED_DIRS: set = set()
+
+
+def _ensure_dir(path: Path) -> Path:
+    path = Path(path)
+    if path not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+    return path
+
 
 def install_copy_shortcut(view: QtWidgets.QTableView) -> None:
     """
@@ -35,15 +160,26 @@ def install_copy_shortcut(view: QtWidgets.QTableView) -> None:
         indexes = view.selectionModel().selectedIndexes()
         if not indexes:
             return
-        indexes = sorted(indexes, key=lambda i: (i.row(), i.column()))
-        rows = {}
+        # Pre-size a dense grid over the selected rows/columns and fill it by
+        # direct indexing; avoids sorting QModelIndexes and per-row dict work.
+        rows_seen = set()
+        cols_seen = set()
         for idx in indexes:
-            rows.setdefault(idx.row(), {})[idx.column()] = idx.data() or ""
-        lines = []
-        for row in sorted(rows):
-            cols = rows[row]
-            lines.append("\t".join(cols.get(c, "") for c in range(max(cols) + 1)))
-        QtWidgets.QApplication.clipboard().setText("\n".join(lines))
+            rows_seen.add(idx.row())
+            cols_seen.add(idx.column())
+        row_map = {r: i for i, r in enumerate(sorted(rows_seen))}
+        col_map = {c: i for i, c in enumerate(sorted(cols_seen))}
+        grid = [[""] * len(col_map) for _ in range(len(row_map))]
+        for idx in indexes:
+            grid[row_map[idx.row()]][col_map[idx.column()]] = idx.data() or ""
+        # Stream into one buffer so huge selections only allocate the final
+        # string once, instead of a per-row string plus a joined copy.
+        out = StringIO()
+        for i, row in enumerate(grid):
+            if i:
+                out.write("\n")
+            out.write("\t".join(row))
+        QtWidgets.QApplication.clipboard().setText(out.getvalue())
 
     shortcut = QtGui.QShortcut(QtGui.QKeySequence(QtGui.QKeySequence.StandardKey.Copy), view)
     shortcut.activated.connect(copy)
@@ -73,6 +209,8 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.setWindowTitle("Inventory Manager")
         self.resize(1200, 800)
+        # Room for a few dozen scaled label previews (limit is in KiB).
+        QtGui.QPixmapCache.setCacheLimit(20480)
         self._restore_geometry()
         self._build_menu()
         self._build_tabs()
@@ -107,18 +245,38 @@ class MainWindow(QtWidgets.QMainWindow):
             self.id_repo,
             save_dir=Path(self.config.backup.directory) / "labels",
         )
-        exports_dir = Path(self.config.backup.directory) / "exports"
-        exports_dir.mkdir(parents=True, exist_ok=True)
-        self.view_tab = ViewTab(self.inventory_repo, exports_dir)
-        self.audit_tab = AuditTab(
-            self.location_repo, self.inventory_repo, self.audit_repo
-        )
+        exports_dir = _ensure_dir(Path(self.config.backup.directory) / "exports")
+        # View and Audit each query the database on construction; defer them
+        # until their tab is first opened so window open only loads Manage.
+        self.view_tab: Optional[ViewTab] = None
+        self.audit_tab: Optional[AuditTab] = None
+        self._tab_factories = {
+            1: lambda: ViewTab(self.inventory_repo, exports_dir),
+            2: lambda: AuditTab(
+                self.location_repo, self.inventory_repo, self.audit_repo
+            ),
+        }
 
         self.tabs.addTab(self.manage_tab, "Manage")
-        self.tabs.addTab(self.view_tab, "View")
-        self.tabs.addTab(self.audit_tab, "Audit")
+        self.tabs.addTab(QtWidgets.QWidget(), "View")
+        self.tabs.addTab(QtWidgets.QWidget(), "Audit")
+        self.tabs.currentChanged.connect(self._ensure_tab)
         self.setCentralWidget(self.tabs)
 
+    def _ensure_tab(self, index: int) -> None:
+        factory = self._tab_factories.pop(index, None)
+        if factory is None:
+            return
+        widget = factory()
+        if index == 1:
+            self.view_tab = widget
+        else:
+            self.audit_tab = widget
+        title = self.tabs.tabText(index)
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, widget, title)
+        self.tabs.setCurrentIndex(index)
+
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:  # type: ignore[override]
         self.settings.setValue("window/geometry", self.saveGeometry())
         self.settings.setValue("window/state", self.saveState())
@@ -180,8 +338,8 @@ class ManageTab(QtWidgets.QWidget):
         self.asset_label_dir = label_root / "assets"
         self.vehicle_label_dir = label_root / "vehicles"
         self.location_label_dir = label_root / "locations"
-        for d in [self.asset_label_dir, self.vehicle_label_dir, self.location_label_dir]:
-            d.mkdir(parents=True, exist_ok=True)
+        for d in (self.asset_label_dir, self.vehicle_label_dir, self.location_label_dir):
+            _ensure_dir(d)
         layout = QtWidgets.QVBoxLayout(self)
         tabs = QtWidgets.QTabWidget()
         tabs.addTab(
@@ -207,11 +365,8 @@ class InventoryPane(QtWidgets.QWidget):
         self.location_repo = location_repo
         self.vehicle_repo = vehicle_repo
         self.id_repo = id_repo
-        self.save_dir = Path(save_dir)
-        self.save_dir.mkdir(parents=True, exist_ok=True)
+        self.save_dir = _ensure_dir(save_dir)
         self.current_asset_id: Optional[str] = None
-        self._barcode_pixmap: Optional[QtGui.QPixmap] = None
-        self._qr_pixmap: Optional[QtGui.QPixmap] = None
         self._barcode_image = None
         self._qr_image = None
         self._label_font_size = 11
@@ -219,9 +374,26 @@ class InventoryPane(QtWidgets.QWidget):
         self._default_module_width = 0.15
         self._default_module_height = 8
         self._default_quiet_zone = 1.5
-        self._completers: list[QtWidgets.QCompleter] = []
+        self._cached_opts: Optional[dict] = None
+        self._info_lines_cache: Optional[tuple[tuple, list]] = None
+        self._completer_models: dict[str, QtGui.QStandardItemModel] = {}
+        self._completer_values: dict[str, list[str]] = {}
         self._dirty = False
         self._last_selection: Optional[QtCore.QModelIndex] = None
+        # Coalesce bursts of rerender signals (spinbox drags, typing in the
+        # custom label box) into a single render pass.
+        self._rerender_timer = QtCore.QTimer(self)
+        self._rerender_timer.setSingleShot(True)
+        self._rerender_timer.setInterval(150)
+        self._rerender_timer.timeout.connect(self._do_rerender_codes)
+        # Stale-result guard for renders delivered from the thread pool.
+        self._render_gen = 0
+        self._needs_rerender = False
+        # Content keys of the renders in flight, used to cache scaled previews.
+        self._render_keys: dict = {}
+        self._render_signals = _CodeRenderSignals()
+        self._render_signals.finished.connect(self._on_code_rendered)
+        self._render_signals.failed.connect(self._on_code_render_failed)
         self._build_ui()
         self.refresh_table()
 
@@ -232,10 +404,10 @@ class InventoryPane(QtWidgets.QWidget):
 
         # Table on the left
         self.table_model = InventoryTableModel()
+        # Filtering happens in SQL via list_inventory_filtered; the proxy is
+        # kept purely so header clicks can sort without re-querying.
         self.table_proxy = QtCore.QSortFilterProxyModel()
         self.table_proxy.setSourceModel(self.table_model)
-        self.table_proxy.setFilterCaseSensitivity(QtCore.Qt.CaseSensitivity.CaseInsensitive)
-        self.table_proxy.setFilterKeyColumn(-1)
 
         self.search_input = QtWidgets.QLineEdit()
         self.search_input.setPlaceholderText("Search any column")
@@ -414,12 +586,17 @@ class InventoryPane(QtWidgets.QWidget):
         self.qr_format_combo.setToolTip("Select QR export format")
         self.save_barcode_btn = QtWidgets.QPushButton("Save Barcode")
         self.save_qr_btn = QtWidgets.QPushButton("Save QR")
+        self.optimize_save_cb = QtWidgets.QCheckBox("Optimize PNG")
+        self.optimize_save_cb.setToolTip(
+            "Spend extra time compressing saved PNGs; off saves faster"
+        )
         export_row.addWidget(QtWidgets.QLabel("Barcode format"))
         export_row.addWidget(self.barcode_format_combo)
         export_row.addWidget(self.save_barcode_btn)
         export_row.addWidget(QtWidgets.QLabel("QR format"))
         export_row.addWidget(self.qr_format_combo)
         export_row.addWidget(self.save_qr_btn)
+        export_row.addWidget(self.optimize_save_cb)
         form_layout.addRow(export_row)
 
         self.new_btn.clicked.connect(self._clear_form)
@@ -439,6 +616,13 @@ class InventoryPane(QtWidgets.QWidget):
         self.quiet_zone_spin.valueChanged.connect(self._rerender_codes)
         self.dpi_spin.valueChanged.connect(self._update_dpi)
         self.text_font_size_spin.valueChanged.connect(self._rerender_codes)
+        # Writer options only change with these inputs; drop the cached dict then.
+        self.module_width_spin.valueChanged.connect(self._invalidate_writer_options)
+        self.module_height_spin.valueChanged.connect(self._invalidate_writer_options)
+        self.quiet_zone_spin.valueChanged.connect(self._invalidate_writer_options)
+        self.dpi_spin.valueChanged.connect(self._invalidate_writer_options)
+        self.text_font_size_spin.valueChanged.connect(self._invalidate_writer_options)
+        self.show_text_cb.toggled.connect(self._invalidate_writer_options)
         self.save_barcode_btn.clicked.connect(lambda: self._save_image("barcode"))
         self.save_qr_btn.clicked.connect(lambda: self._save_image("qr"))
         scroll = QtWidgets.QScrollArea()
@@ -452,9 +636,25 @@ class InventoryPane(QtWidgets.QWidget):
     def refresh_table(self) -> None:
         search = self.search_input.text().strip()
         items, _ = self.inventory_repo.list_inventory_filtered(search=search, limit=500, offset=0)
-        self.table_model.set_rows([asdict(item) for item in items])
+        # Freeze repaints and selection callbacks while 500 rows are swapped;
+        # the reset must not detour through _on_selection's unsaved-changes
+        # dialog, and the view should relayout once rather than per change.
+        self.table.setUpdatesEnabled(False)
+        sel_model = self.table.selectionModel()
+        if sel_model:
+            sel_model.blockSignals(True)
+        try:
+            self.table_model.set_rows(
+                [dict(zip(_INV_FIELDS, _INV_GET(item))) for item in items]
+            )
+        finally:
+            if sel_model:
+                sel_model.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
+        # Indexes are stale after a reset; a row click must not be mistaken
+        # for a re-click of the previous selection.
+        self._last_selection = None
         self._update_completers(items)
-        self.table_proxy.invalidate()
 
     def _mark_dirty(self) -> None:
         self._dirty = True
@@ -474,8 +674,6 @@ class InventoryPane(QtWidgets.QWidget):
         self.consumable_checkbox.setChecked(False)
         self.created_label.setText("-")
         self.updated_label.setText("-")
-        self._barcode_pixmap = None
-        self._qr_pixmap = None
         self._barcode_image = None
         self._qr_image = None
         self.barcode_label.setText("Barcode preview")
@@ -486,6 +684,9 @@ class InventoryPane(QtWidgets.QWidget):
     def _toggle_details(self, hide: bool, splitter: QtWidgets.QSplitter) -> None:
         self.detail_panel.setVisible(not hide)
         self.toggle_details_btn.setText("Show Details" if hide else "Hide Details")
+        if not hide and self._needs_rerender:
+            self._needs_rerender = False
+            self._rerender_codes()
         if hide:
             splitter.setSizes([1, 0])
         else:
@@ -498,6 +699,14 @@ class InventoryPane(QtWidgets.QWidget):
         indexes = sel_model.selectedRows()
         if not indexes:
             return
+        # Clicking the already-selected row (common during drag-select) would
+        # otherwise repopulate the form and re-render both codes for nothing.
+        if (
+            self._last_selection is not None
+            and indexes[0] == self._last_selection
+            and not self._dirty
+        ):
+            return
         if self._dirty:
             choice = QtWidgets.QMessageBox.question(
                 self,
@@ -529,7 +738,10 @@ class InventoryPane(QtWidgets.QWidget):
         self.consumable_checkbox.setChecked(bool(row.get("consumable")))
         self.created_label.setText(row.get("created_at") or "-")
         self.updated_label.setText(row.get("updated_at") or "-")
-        self._render_codes(self.current_asset_id)
+        # Let the selection paint before the render key computation runs;
+        # rapid arrow-key navigation then skips intermediate renders via the
+        # stale-generation guard.
+        QtCore.QTimer.singleShot(0, self._do_rerender_codes)
 
     def _save(self) -> None:
         description = self.description_input.text().strip()
@@ -606,6 +818,11 @@ class InventoryPane(QtWidgets.QWidget):
         Render barcode and QR previews for the selected asset, optionally including
         description and location labels.
         """
+        if not self.detail_panel.isVisibleTo(self):
+            # Nobody can see the previews; render once when the panel reopens.
+            # isVisibleTo ignores whether the window itself is shown yet.
+            self._needs_rerender = True
+            return
         if not asset_id:
             self.barcode_label.setText("Barcode preview")
             self.barcode_label.setPixmap(QtGui.QPixmap())
@@ -616,73 +833,107 @@ class InventoryPane(QtWidgets.QWidget):
             return
 
         code_data = self.custom_code_input.text().strip() or asset_id
-        info_lines = []
-        if self.include_id_cb.isChecked():
-            info_lines.append(f"ID: {asset_id}")
-            if code_data != asset_id:
+        # Rebuilding the label lines touches every text field; reuse the last
+        # result when nothing text-related changed (e.g. spinbox-only edits).
+        state = (
+            asset_id,
+            self.custom_code_input.text(),
+            self.description_input.text(),
+            self.location_input.text(),
+            self.custom_label_text.toPlainText(),
+            self.include_id_cb.isChecked(),
+            self.include_desc_cb.isChecked(),
+            self.include_location_cb.isChecked(),
+        )
+        if self._info_lines_cache is not None and self._info_lines_cache[0] == state:
+            info_lines = self._info_lines_cache[1]
+        else:
+            info_lines = []
+            if self.include_id_cb.isChecked():
+                info_lines.append(f"ID: {asset_id}")
+                if code_data != asset_id:
+                    info_lines.append(code_data)
+            elif code_data != asset_id:
                 info_lines.append(code_data)
-        elif code_data != asset_id:
-            info_lines.append(code_data)
-        if self.include_desc_cb.isChecked():
-            desc = self.description_input.text().strip()
-            if desc:
-                info_lines.append(desc)
-        if self.include_location_cb.isChecked():
-            loc_text = self._location_text(self.location_input.text().strip())
-            if loc_text:
-                info_lines.append(loc_text)
-        custom_lines = [
-            line.strip() for line in self.custom_label_text.toPlainText().splitlines() if line.strip()
-        ]
-        info_lines.extend(custom_lines)
+            if self.include_desc_cb.isChecked():
+                desc = self.description_input.text().strip()
+                if desc:
+                    info_lines.append(desc)
+            if self.include_location_cb.isChecked():
+                loc_text = self._location_text(self.location_input.text().strip())
+                if loc_text:
+                    info_lines.append(loc_text)
+            custom_lines = [
+                line.strip() for line in self.custom_label_text.toPlainText().splitlines() if line.strip()
+            ]
+            info_lines.extend(custom_lines)
+            self._info_lines_cache = (state, info_lines)
+
+        options_key = tuple(sorted(self._barcode_writer_options().items()))
+        layout = self.layout_combo.currentText()
+        font_size = self._label_font_size
+        qr_data = "\n".join(info_lines)
+        attach = attach_label
+        lines_key = hash(tuple(info_lines))
+        render_keys = {
+            "barcode": f"bc|{code_data}|{hash(options_key)}|{layout}|{font_size}|{lines_key}",
+            "qr": f"qr|{hash(qr_data)}|{layout}|{font_size}|{lines_key}",
+        }
+        # If the displayed composites were produced from these exact inputs
+        # (e.g. a checkbox toggled off and straight back on), skip the render.
+        if (
+            render_keys == self._render_keys
+            and self._barcode_image is not None
+            and self._qr_image is not None
+        ):
+            return
+        # Rasterize off the GUI thread; results come back through
+        # _render_signals and are dropped when a newer render superseded them.
+        self._render_gen += 1
+        generation = self._render_gen
+        self._render_keys = render_keys
+
+        def render_barcode():
+            base = render_barcode_raw(code_data, options_key)
+            return attach(base, info_lines, layout=layout, font_size=font_size)
+
+        def render_qr():
+            base = render_qr_raw(qr_data)
+            return attach(base, info_lines, layout=layout, font_size=font_size)
+
+        pool = QtCore.QThreadPool.globalInstance()
+        pool.start(
+            _CodeRenderJob("barcode", render_barcode, generation, self._render_signals, (200, 120))
+        )
+        pool.start(
+            _CodeRenderJob("qr", render_qr, generation, self._render_signals, (160, 160))
+        )
 
-        # Barcode
-        try:
-            code39_cls = barcode.get_barcode_class("code39")
-            code39 = code39_cls(code_data, writer=ImageWriter(), add_checksum=False)
-            buffer = BytesIO()
-            code39.write(
-                buffer,
-                options=self._barcode_writer_options(),
-            )
-            self._barcode_image = self._attach_label(
-                buffer.getvalue(),
-                info_lines,
-                layout=self.layout_combo.currentText(),
-                font_size=self._label_font_size,
-            )
-            self._barcode_pixmap = self._pil_to_pixmap(self._barcode_image)
-            scaled = self._barcode_pixmap.scaled(
-                200,
-                120,
-                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-                QtCore.Qt.TransformationMode.SmoothTransformation,
-            )
+    def _on_code_rendered(self, kind: str, image, qimage, generation: int) -> None:
+        if generation != self._render_gen:
+            return
+        target_w, target_h = (200, 120) if kind == "barcode" else (160, 160)
+        # The job already delivers preview-sized pixels; identical content
+        # (e.g. toggling an option back) still hits QPixmapCache.
+        cache_key = f"{self._render_keys.get(kind, '')}|{target_w}x{target_h}"
+        scaled = QtGui.QPixmapCache.find(cache_key)
+        if scaled is None:
+            scaled = QtGui.QPixmap.fromImage(qimage)
+            QtGui.QPixmapCache.insert(cache_key, scaled)
+        if kind == "barcode":
+            self._barcode_image = image
             self.barcode_label.setPixmap(scaled)
-        except Exception as exc:  # pylint: disable=broad-except
-            logger.warning("Failed to render barcode: %s", exc)
-            self.barcode_label.setText("Barcode unavailable")
+        else:
+            self._qr_image = image
+            self.qr_label.setPixmap(scaled)
 
-        # QR code
-        try:
-            qr_data = "\n".join(info_lines)
-            qr_img = self._generate_qr(qr_data)
-            self._qr_image = self._attach_label_from_image(
-                qr_img,
-                info_lines,
-                layout=self.layout_combo.currentText(),
-                font_size=self._label_font_size,
-            )
-            self._qr_pixmap = self._pil_to_pixmap(self._qr_image)
-            scaled_qr = self._qr_pixmap.scaled(
-                160,
-                160,
-                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-                QtCore.Qt.TransformationMode.SmoothTransformation,
-            )
-            self.qr_label.setPixmap(scaled_qr)
-        except Exception as exc:  # pylint: disable=broad-except
-            logger.warning("Failed to render QR: %s", exc)
+    def _on_code_render_failed(self, kind: str, message: str, generation: int) -> None:
+        if generation != self._render_gen:
+            return
+        logger.warning("Failed to render %s: %s", kind, message)
+        if kind == "barcode":
+            self.barcode_label.setText("Barcode unavailable")
+        else:
             self.qr_label.setText("QR unavailable")
 
     def _location_text(self, location_id: str) -> str:
@@ -698,73 +949,6 @@ class InventoryPane(QtWidgets.QWidget):
         vehicle_part = f"{vehicle_name} " if vehicle_name else ""
         return f"{vehicle_part}{loc.side} Row {loc.row} Bin {loc.bin}"
 
-    def _attach_label(self, base_bytes: bytes, lines, *, layout: str, font_size: int) -> "Image.Image":
-        from PIL import Image, ImageDraw, ImageFont
-
-        base = Image.open(BytesIO(base_bytes)).convert("RGB")
-        return self._attach_label_from_image(base, lines, layout=layout, font_size=font_size)
-
-    def _attach_label_from_image(self, base, lines, *, layout: str, font_size: int) -> "Image.Image":
-        from PIL import Image, ImageDraw, ImageFont
-
-        if not lines:
-            return base
-        font = ImageFont.load_default()
-        # Use DejaVuSans if available to honor font size changes.
-        try:
-            font_path = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
-            font = ImageFont.truetype(font_path, font_size)
-        except Exception:
-            try:
-                font = ImageFont.truetype("DejaVuSans.ttf", font_size)
-            except Exception:
-                font = ImageFont.load_default()
-        padding = 4
-        line_height = font.getbbox("Ag")[3]
-        text_width = max(font.getbbox(line)[2] for line in lines) + padding * 2
-
-        if layout == "Right of code":
-            width = base.width + text_width
-            height = max(base.height, (line_height + 4) * len(lines) + padding * 2)
-            canvas = Image.new("RGB", (width, height), "white")
-            canvas.paste(base, (0, (height - base.height) // 2))
-            draw = ImageDraw.Draw(canvas)
-            x_text = base.width + padding
-            y_start = (height - (line_height + 4) * len(lines)) // 2
-            for i, line in enumerate(lines):
-                draw.text((x_text, y_start + i * (line_height + 4)), line, fill="black", font=font)
-        else:  # Below code
-            width = max(base.width, text_width)
-            height = base.height + padding + (line_height + 4) * len(lines)
-            canvas = Image.new("RGB", (width, height), "white")
-            canvas.paste(base, ((width - base.width) // 2, 0))
-            draw = ImageDraw.Draw(canvas)
-            y_start = base.height + padding
-            for i, line in enumerate(lines):
-                draw.text((padding, y_start + i * (line_height + 4)), line, fill="black", font=font)
-        return canvas
-
-    def _generate_qr(self, data: str):
-        import qrcode
-
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_M,
-            box_size=6,
-            border=2,
-        )
-        qr.add_data(data)
-        qr.make(fit=True)
-        img = qr.make_image(fill_color="black", back_color="white").convert("RGB")
-        return img
-
-    def _pil_to_pixmap(self, image) -> QtGui.QPixmap:
-        buf = BytesIO()
-        image.save(buf, format="PNG")
-        pixmap = QtGui.QPixmap()
-        pixmap.loadFromData(buf.getvalue())
-        return pixmap
-
     def _save_image(self, kind: str) -> None:
         if kind == "barcode":
             image = self._barcode_image
@@ -780,7 +964,7 @@ class InventoryPane(QtWidgets.QWidget):
             )
             return
         base_label = self.description_input.text().strip() or "asset"
-        default_name = self._default_filename(base_label, self.current_asset_id or "id", fmt)
+        default_name = default_filename(base_label, self.current_asset_id or "id", fmt)
         default_path = str(self.save_dir / default_name)
         filters = {
             "barcode": ";;".join(
@@ -800,15 +984,23 @@ class InventoryPane(QtWidgets.QWidget):
             if kind == "barcode" and ext == ".svg":
                 from barcode.writer import SVGWriter
 
-                code39_cls = barcode.get_barcode_class("code39")
                 code_data = self.custom_code_input.text().strip() or (self.current_asset_id or "")
-                code39 = code39_cls(code_data, writer=SVGWriter(), add_checksum=False)
+                code39 = CODE39(code_data, writer=SVGWriter(), add_checksum=False)
                 code39.save(path, options=self._barcode_writer_options())
             else:
                 fmt_param = "PNG"
                 if ext == ".eps":
                     fmt_param = "EPS"
-                image.save(path, format=fmt_param, dpi=(self._label_dpi, self._label_dpi))
+                save_kwargs = {"dpi": (self._label_dpi, self._label_dpi)}
+                if fmt_param == "PNG":
+                    # zlib level dominates PNG save time; these mostly-white
+                    # label images compress to near-identical sizes at level
+                    # 1, so full optimize stays opt-in for archival exports.
+                    if self.optimize_save_cb.isChecked():
+                        save_kwargs.update(compress_level=6, optimize=True)
+                    else:
+                        save_kwargs["compress_level"] = LABEL_PNG_COMPRESS_LEVEL
+                image.save(path, format=fmt_param, **save_kwargs)
         except Exception as exc:  # pylint: disable=broad-except
             QtWidgets.QMessageBox.warning(self, "Save failed", str(exc))
         else:
@@ -817,6 +1009,9 @@ class InventoryPane(QtWidgets.QWidget):
             )
 
     def _rerender_codes(self) -> None:
+        self._rerender_timer.start()
+
+    def _do_rerender_codes(self) -> None:
         if self.current_asset_id:
             self._render_codes(self.current_asset_id)
 
@@ -824,69 +1019,103 @@ class InventoryPane(QtWidgets.QWidget):
         self._label_font_size = value
         self._rerender_codes()
 
+    def _invalidate_writer_options(self) -> None:
+        self._cached_opts = None
+
     def _barcode_writer_options(self) -> dict:
-        return {
-            "quiet_zone": float(self.quiet_zone_spin.value()),
-            "module_height": int(self.module_height_spin.value()),
-            "module_width": float(self.module_width_spin.value()),
-            "write_text": self.show_text_cb.isChecked(),
-            "dpi": int(self.dpi_spin.value()),
-            "font_size": int(self.text_font_size_spin.value()),
-        }
+        if self._cached_opts is None:
+            self._cached_opts = {
+                "quiet_zone": float(self.quiet_zone_spin.value()),
+                "module_height": int(self.module_height_spin.value()),
+                "module_width": float(self.module_width_spin.value()),
+                "write_text": self.show_text_cb.isChecked(),
+                "dpi": int(self.dpi_spin.value()),
+                "font_size": int(self.text_font_size_spin.value()),
+            }
+        return self._cached_opts
 
     def _update_dpi(self, value: int) -> None:
         self._label_dpi = value
         self._rerender_codes()
 
-    def _default_filename(self, name: str, ident: str, fmt: str) -> str:
-        safe_name = "".join(ch if ch.isalnum() else "_" for ch in name)[:40] or "label"
-        safe_id = "".join(ch if ch.isalnum() else "_" for ch in ident)[:20] or "id"
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-        return f"{safe_name}_{safe_id}_{ts}.{fmt}"
-
     def _update_completers(self, items: list[InventoryItem]) -> None:
-        def completer(values: set[str]) -> QtWidgets.QCompleter:
-            model = QtGui.QStandardItemModel()
-            for val in sorted(values):
-                item = QtGui.QStandardItem(val)
-                model.appendRow(item)
-            comp = QtWidgets.QCompleter(model, self)
-            comp.setCaseSensitivity(QtCore.Qt.CaseSensitivity.CaseInsensitive)
-            comp.setCompletionMode(QtWidgets.QCompleter.CompletionMode.PopupCompletion)
-            comp.setFilterMode(QtCore.Qt.MatchFlag.MatchContains)
-            comp.setModelSorting(QtWidgets.QCompleter.ModelSorting.UnsortedModel)
-            self._completers.append(comp)
-            return comp
-
-        descs = {i.description for i in items if i.description}
-        mans = {i.manufacturer for i in items if i.manufacturer}
-        models = {i.model for i in items if i.model}
-        serials = {i.serial_number for i in items if i.serial_number}
-        locs = {i.location_id for i in items if i.location_id}
-
-        self.description_input.setCompleter(completer(descs))
-        self.manufacturer_input.setCompleter(completer(mans))
-        self.model_input.setCompleter(completer(models))
-        self.serial_input.setCompleter(completer(serials))
-        self.location_input.setCompleter(completer(locs))
+        # Completers and their models persist across refreshes; a refresh that
+        # leaves a field's value set unchanged (the common case) costs one
+        # sorted-list comparison instead of a model rebuild.
+        descs: set = set()
+        mans: set = set()
+        models: set = set()
+        serials: set = set()
+        locs: set = set()
+        # One walk over the items feeds every field's value set, instead of a
+        # separate comprehension (and pass) per field.
+        for i in items:
+            if i.description:
+                descs.add(i.description)
+            if i.manufacturer:
+                mans.add(i.manufacturer)
+            if i.model:
+                models.add(i.model)
+            if i.serial_number:
+                serials.add(i.serial_number)
+            if i.location_id:
+                locs.add(i.location_id)
+        fields = (
+            (self.description_input, "description", descs),
+            (self.manufacturer_input, "manufacturer", mans),
+            (self.model_input, "model", models),
+            (self.serial_input, "serial_number", serials),
+            (self.location_input, "location_id", locs),
+        )
+        for widget, attr, value_set in fields:
+            values = sorted(value_set)
+            if self._completer_values.get(attr) == values:
+                continue
+            self._completer_values[attr] = values
+            model = self._completer_models.get(attr)
+            if model is None:
+                model = QtGui.QStandardItemModel(self)
+                self._completer_models[attr] = model
+                comp = QtWidgets.QCompleter(model, self)
+                comp.setCaseSensitivity(QtCore.Qt.CaseSensitivity.CaseInsensitive)
+                comp.setCompletionMode(QtWidgets.QCompleter.CompletionMode.PopupCompletion)
+                comp.setFilterMode(QtCore.Qt.MatchFlag.MatchContains)
+                comp.setModelSorting(QtWidgets.QCompleter.ModelSorting.UnsortedModel)
+                widget.setCompleter(comp)
+            model.clear()
+            # appendColumn inserts all rows in one C++ call.
+            model.appendColumn([QtGui.QStandardItem(v) for v in values])
 
 
 class VehiclePane(QtWidgets.QWidget):
     def __init__(self, vehicle_repo: VehicleRepository, save_dir: Path):
         super().__init__()
         self.vehicle_repo = vehicle_repo
-        self.save_dir = Path(save_dir)
-        self.save_dir.mkdir(parents=True, exist_ok=True)
+        self.save_dir = _ensure_dir(save_dir)
         self.current_vehicle_id: Optional[str] = None
         self._barcode_image = None
         self._qr_image = None
-        self._barcode_pixmap: Optional[QtGui.QPixmap] = None
-        self._qr_pixmap: Optional[QtGui.QPixmap] = None
         self._label_font_size = 11
         self._label_dpi = 300
         self._default_module_width = 0.15
         self._default_module_height = 8
         self._default_quiet_zone = 1.5
+        # Fingerprint of the last completed render; unchanged inputs skip
+        # the pipeline entirely.
+        self._last_render_key: Optional[tuple] = None
+        # Stale-result guard for renders delivered from the thread pool.
+        self._render_gen = 0
+        self._needs_rerender = False
+        self._render_cache_ns = ""
+        self._render_signals = _CodeRenderSignals()
+        self._render_signals.finished.connect(self._on_code_rendered)
+        self._render_signals.failed.connect(self._on_code_render_failed)
+        # Coalesce bursts of rerender signals into one render, as the
+        # inventory pane does.
+        self._rerender_timer = QtCore.QTimer(self)
+        self._rerender_timer.setSingleShot(True)
+        self._rerender_timer.setInterval(150)
+        self._rerender_timer.timeout.connect(self._do_rerender_codes)
         self._build_ui()
         self.refresh_table()
 
@@ -896,10 +1125,8 @@ class VehiclePane(QtWidgets.QWidget):
         layout.addWidget(splitter)
 
         self.table_model = VehicleTableModel()
-        self.table_proxy = QtCore.QSortFilterProxyModel()
+        self.table_proxy = SearchFilterProxyModel()
         self.table_proxy.setSourceModel(self.table_model)
-        self.table_proxy.setFilterCaseSensitivity(QtCore.Qt.CaseSensitivity.CaseInsensitive)
-        self.table_proxy.setFilterKeyColumn(-1)
         self.table = QtWidgets.QTableView()
         self.table.setModel(self.table_proxy)
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectionBehavior.SelectRows)
@@ -1048,12 +1275,17 @@ class VehiclePane(QtWidgets.QWidget):
         self.qr_format_combo.setToolTip("Select QR export format")
         self.save_barcode_btn = QtWidgets.QPushButton("Save Barcode")
         self.save_qr_btn = QtWidgets.QPushButton("Save QR")
+        self.optimize_save_cb = QtWidgets.QCheckBox("Optimize PNG")
+        self.optimize_save_cb.setToolTip(
+            "Spend extra time compressing saved PNGs; off saves faster"
+        )
         export_row.addWidget(QtWidgets.QLabel("Barcode format"))
         export_row.addWidget(self.barcode_format_combo)
         export_row.addWidget(self.save_barcode_btn)
         export_row.addWidget(QtWidgets.QLabel("QR format"))
         export_row.addWidget(self.qr_format_combo)
         export_row.addWidget(self.save_qr_btn)
+        export_row.addWidget(self.optimize_save_cb)
         form_layout.addRow(export_row)
         self.save_barcode_btn.setToolTip("Export barcode as PNG/SVG/EPS (Brother-friendly PNG recommended)")
         self.save_qr_btn.setToolTip("Export QR as PNG/EPS")
@@ -1088,8 +1320,10 @@ class VehiclePane(QtWidgets.QWidget):
         splitter.setStretchFactor(1, 2)
 
     def refresh_table(self) -> None:
-        vehicles = self.vehicle_repo.list_vehicles()
-        self.table_model.set_rows([asdict(v) for v in vehicles])
+        vehicles = self.vehicle_repo.iter_vehicles()
+        self.table_model.set_rows(
+            [dict(zip(_VEH_FIELDS, _VEH_GET(v))) for v in vehicles]
+        )
 
     def _clear_form(self) -> None:
         self.current_vehicle_id = None
@@ -1105,10 +1339,7 @@ class VehiclePane(QtWidgets.QWidget):
         self._qr_image = None
         self.barcode_label.setPixmap(QtGui.QPixmap())
         self.qr_label.setPixmap(QtGui.QPixmap())
-        self._barcode_image = None
-        self._qr_image = None
-        self.barcode_label.setPixmap(QtGui.QPixmap())
-        self.qr_label.setPixmap(QtGui.QPixmap())
+        self._last_render_key = None
 
     def _on_selection(self) -> None:
         sel_model = self.table.selectionModel()
@@ -1132,7 +1363,9 @@ class VehiclePane(QtWidgets.QWidget):
         self.last_service_input.setValue(int(row.get("last_service", 0) or 0))
         self.created_label.setText(row.get("created_at", "-"))
         self.updated_label.setText(row.get("updated_at", "-"))
-        self._render_codes()
+        # Defer so the selection highlight paints before the synchronous
+        # barcode/QR render runs.
+        QtCore.QTimer.singleShot(0, self._do_rerender_codes)
 
     def _save(self) -> None:
         name = self.name_input.text().strip()
@@ -1191,6 +1424,9 @@ class VehiclePane(QtWidgets.QWidget):
         self.last_service_input.setValue(self.mileage_input.value())
 
     def _render_codes(self) -> None:
+        if not self.detail_panel.isVisibleTo(self):
+            self._needs_rerender = True
+            return
         if not self.current_vehicle_id:
             self.barcode_label.setText("Barcode preview")
             self.barcode_label.setPixmap(QtGui.QPixmap())
@@ -1223,48 +1459,90 @@ class VehiclePane(QtWidgets.QWidget):
         ]
         info_lines.extend(custom_lines)
 
-        try:
-            code39_cls = barcode.get_barcode_class("code39")
-            code39 = code39_cls(code_data, writer=ImageWriter(), add_checksum=False)
-            buffer = BytesIO()
-            code39.write(buffer, options=self._barcode_writer_options())
-            self._barcode_image = self._attach_label(
-                buffer.getvalue(),
-                info_lines,
-                layout=self.layout_combo.currentText(),
-                font_size=self._label_font_size,
-            )
-            self._barcode_pixmap = self._pil_to_pixmap(self._barcode_image)
-            scaled = self._barcode_pixmap.scaled(
-                200,
-                120,
-                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-                QtCore.Qt.TransformationMode.SmoothTransformation,
-            )
-            self.barcode_label.setPixmap(scaled)
-        except Exception as exc:  # pylint: disable=broad-except
-            logger.warning("Failed to render vehicle barcode: %s", exc)
-            self.barcode_label.setText("Barcode unavailable")
+        # Identical effective inputs (e.g. re-selecting the current row, or a
+        # toggle that contributed no label line) need no new render at all.
+        render_key = (
+            code_data,
+            tuple(info_lines),
+            self.layout_combo.currentText(),
+            self._label_font_size,
+            tuple(sorted(self._barcode_writer_options().items())),
+        )
+        if render_key == self._last_render_key and self._barcode_image is not None:
+            return
+        self._last_render_key = render_key
+
+        options_key = render_key[4]
+        layout = self.layout_combo.currentText()
+        font_size = self._label_font_size
+        qr_data = "\n".join(info_lines)
+
+        # Reselecting a vehicle rendered earlier this session hits
+        # QPixmapCache and skips the thread pool entirely; the export images
+        # recompose synchronously from the shared LRU caches.
+        cache_ns = f"veh|{render_key}"
+        cached_barcode = QtGui.QPixmapCache.find(f"{cache_ns}|barcode")
+        cached_qr = QtGui.QPixmapCache.find(f"{cache_ns}|qr")
+        if cached_barcode is not None and cached_qr is not None:
+            try:
+                self._barcode_image = attach_label(
+                    render_barcode_raw(code_data, options_key),
+                    info_lines, layout=layout, font_size=font_size,
+                )
+                self._qr_image = attach_label(
+                    render_qr_raw(qr_data),
+                    info_lines, layout=layout, font_size=font_size,
+                )
+            except Exception as exc:  # pylint: disable=broad-except
+                logger.warning("Cached recompose failed, re-rendering: %s", exc)
+            else:
+                self._render_gen += 1
+                self.barcode_label.setPixmap(cached_barcode)
+                self.qr_label.setPixmap(cached_qr)
+                return
 
-        try:
-            qr_data = "\n".join(info_lines)
-            qr_img = self._generate_qr(qr_data)
-            self._qr_image = self._attach_label_from_image(
-                qr_img,
-                info_lines,
-                layout=self.layout_combo.currentText(),
-                font_size=self._label_font_size,
-            )
-            self._qr_pixmap = self._pil_to_pixmap(self._qr_image)
-            scaled_qr = self._qr_pixmap.scaled(
-                160,
-                160,
-                QtCore.Qt.AspectRatioMode.KeepAspectRatio,
-                QtCore.Qt.TransformationMode.SmoothTransformation,
-            )
-            self.qr_label.setPixmap(scaled_qr)
-        except Exception as exc:  # pylint: disable=broad-except
-            logger.warning("Failed to render vehicle QR: %s", exc)
+        # Rasterize off the GUI thread, like the inventory pane; results come
+        # back through _render_signals and stale generations are dropped. The
+        # shared LRU caches make repeat renders cheap on the worker side.
+        self._render_gen += 1
+        generation = self._render_gen
+        self._render_cache_ns = cache_ns
+
+        def render_barcode():
+            base = render_barcode_raw(code_data, options_key)
+            return attach_label(base, info_lines, layout=layout, font_size=font_size)
+
+        def render_qr():
+            base = render_qr_raw(qr_data)
+            return attach_label(base, info_lines, layout=layout, font_size=font_size)
+
+        pool = QtCore.QThreadPool.globalInstance()
+        pool.start(
+            _CodeRenderJob("barcode", render_barcode, generation, self._render_signals, (200, 120))
+        )
+        pool.start(
+            _CodeRenderJob("qr", render_qr, generation, self._render_signals, (160, 160))
+        )
+
+    def _on_code_rendered(self, kind: str, image, qimage, generation: int) -> None:
+        if generation != self._render_gen:
+            return
+        pixmap = QtGui.QPixmap.fromImage(qimage)
+        QtGui.QPixmapCache.insert(f"{self._render_cache_ns}|{kind}", pixmap)
+        if kind == "barcode":
+            self._barcode_image = image
+            self.barcode_label.setPixmap(pixmap)
+        else:
+            self._qr_image = image
+            self.qr_label.setPixmap(pixmap)
+
+    def _on_code_render_failed(self, kind: str, message: str, generation: int) -> None:
+        if generation != self._render_gen:
+            return
+        logger.warning("Failed to render vehicle %s: %s", kind, message)
+        if kind == "barcode":
+            self.barcode_label.setText("Barcode unavailable")
+        else:
             self.qr_label.setText("QR unavailable")
 
     def _barcode_writer_options(self) -> dict:
@@ -1277,72 +1555,6 @@ class VehiclePane(QtWidgets.QWidget):
             "font_size": int(self.text_font_size_spin.value()),
         }
 
-    def _attach_label(self, base_bytes: bytes, lines, *, layout: str, font_size: int) -> "Image.Image":
-        from PIL import Image, ImageDraw, ImageFont
-
-        base = Image.open(BytesIO(base_bytes)).convert("RGB")
-        return self._attach_label_from_image(base, lines, layout=layout, font_size=font_size)
-
-    def _attach_label_from_image(self, base, lines, *, layout: str, font_size: int) -> "Image.Image":
-        from PIL import Image, ImageDraw, ImageFont
-
-        if not lines:
-            return base
-        font = ImageFont.load_default()
-        try:
-            font_path = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
-            font = ImageFont.truetype(font_path, font_size)
-        except Exception:
-            try:
-                font = ImageFont.truetype("DejaVuSans.ttf", font_size)
-            except Exception:
-                font = ImageFont.load_default()
-        padding = 4
-        line_height = font.getbbox("Ag")[3]
-        text_width = max(font.getbbox(line)[2] for line in lines) + padding * 2
-
-        if layout == "Right of code":
-            width = base.width + text_width
-            height = max(base.height, (line_height + 4) * len(lines) + padding * 2)
-            canvas = Image.new("RGB", (width, height), "white")
-            canvas.paste(base, (0, (height - base.height) // 2))
-            draw = ImageDraw.Draw(canvas)
-            x_text = base.width + padding
-            y_start = (height - (line_height + 4) * len(lines)) // 2
-            for i, line in enumerate(lines):
-                draw.text((x_text, y_start + i * (line_height + 4)), line, fill="black", font=font)
-        else:
-            width = max(base.width, text_width)
-            height = base.height + padding + (line_height + 4) * len(lines)
-            canvas = Image.new("RGB", (width, height), "white")
-            canvas.paste(base, ((width - base.width) // 2, 0))
-            draw = ImageDraw.Draw(canvas)
-            y_start = base.height + padding
-            for i, line in enumerate(lines):
-                draw.text((padding, y_start + i * (line_height + 4)), line, fill="black", font=font)
-        return canvas
-
-    def _generate_qr(self, data: str):
-        import qrcode
-
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_M,
-            box_size=6,
-            border=2,
-        )
-        qr.add_data(data)
-        qr.make(fit=True)
-        img = qr.make_image(fill_color="black", back_color="white").convert("RGB")
-        return img
-
-    def _pil_to_pixmap(self, image) -> QtGui.QPixmap:
-        buf = BytesIO()
-        image.save(buf, format="PNG")
-        pixmap = QtGui.QPixmap()
-        pixmap.loadFromData(buf.getvalue())
-        return pixmap
-
     def _save_image(self, kind: str) -> None:
         if kind == "barcode":
             image = self._barcode_image
@@ -1358,7 +1570,7 @@ class VehiclePane(QtWidgets.QWidget):
             )
             return
         base_label = self.name_input.text().strip() or "vehicle"
-        default_name = self._default_filename(base_label, self.current_vehicle_id or "id", fmt)
+        default_name = default_filename(base_label, self.current_vehicle_id or "id", fmt)
         default_path = str(self.save_dir / default_name)
         filters = {
             "barcode": ";;".join(
@@ -1378,15 +1590,23 @@ class VehiclePane(QtWidgets.QWidget):
             if kind == "barcode" and ext == ".svg":
                 from barcode.writer import SVGWriter
 
-                code39_cls = barcode.get_barcode_class("code39")
                 code_data = self.custom_code_input.text().strip() or (self.current_vehicle_id or "")
-                code39 = code39_cls(code_data, writer=SVGWriter(), add_checksum=False)
+                code39 = CODE39(code_data, writer=SVGWriter(), add_checksum=False)
                 code39.save(path, options=self._barcode_writer_options())
             else:
                 fmt_param = "PNG"
                 if ext == ".eps":
                     fmt_param = "EPS"
-                image.save(path, format=fmt_param, dpi=(self._label_dpi, self._label_dpi))
+                save_kwargs = {"dpi": (self._label_dpi, self._label_dpi)}
+                if fmt_param == "PNG":
+                    # zlib level dominates PNG save time; these mostly-white
+                    # label images compress to near-identical sizes at level
+                    # 1, so full optimize stays opt-in for archival exports.
+                    if self.optimize_save_cb.isChecked():
+                        save_kwargs.update(compress_level=6, optimize=True)
+                    else:
+                        save_kwargs["compress_level"] = LABEL_PNG_COMPRESS_LEVEL
+                image.save(path, format=fmt_param, **save_kwargs)
         except Exception as exc:  # pylint: disable=broad-except
             QtWidgets.QMessageBox.warning(self, "Save failed", str(exc))
         else:
@@ -1395,6 +1615,9 @@ class VehiclePane(QtWidgets.QWidget):
             )
 
     def _rerender_codes(self) -> None:
+        self._rerender_timer.start()
+
+    def _do_rerender_codes(self) -> None:
         if self.current_vehicle_id:
             self._render_codes()
 
@@ -1409,24 +1632,20 @@ class VehiclePane(QtWidgets.QWidget):
     def _toggle_details(self, hide: bool, splitter: QtWidgets.QSplitter) -> None:
         self.detail_panel.setVisible(not hide)
         self.toggle_details_btn.setText("Show Details" if hide else "Hide Details")
+        if not hide and self._needs_rerender:
+            self._needs_rerender = False
+            self._rerender_codes()
         if hide:
             splitter.setSizes([1, 0])
         else:
             splitter.setSizes([2, 1])
 
-    def _default_filename(self, name: str, ident: str, fmt: str) -> str:
-        safe_name = "".join(ch if ch.isalnum() else "_" for ch in name)[:40] or "label"
-        safe_id = "".join(ch if ch.isalnum() else "_" for ch in ident)[:20] or "id"
-        ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-        return f"{safe_name}_{safe_id}_{ts}.{fmt}"
-
 
 class ViewTab(QtWidgets.QWidget):
     def __init__(self, inventory_repo: InventoryRepository, export_dir: Path):
         super().__init__()
         self.inventory_repo = inventory_repo
-        self.export_dir = Path(export_dir)
-        self.export_dir.mkdir(parents=True, exist_ok=True)
+        self.export_dir = _ensure_dir(export_dir)
         self.headers = [
             "asset_id",
             "location_id",
@@ -1447,6 +1666,18 @@ class ViewTab(QtWidgets.QWidget):
         self.page_size = 50
         self.page = 0
         self.total = 0
+        # Worker queries need their own connection: the GUI-thread one is
+        # bound to its creating thread by sqlite3's default check.
+        self._reader_repo: Optional[InventoryRepository] = None
+        self._query_seq = 0
+        self._query_signals = _QuerySignals()
+        self._query_signals.loaded.connect(self._on_rows_loaded)
+        self._query_signals.failed.connect(self._on_load_failed)
+        # COUNT(*) result per filter set; pagination and sort changes reuse
+        # it instead of recounting.
+        self._cached_filters_key: Optional[tuple] = None
+        self._cached_total: Optional[int] = None
+        self._pending_filters_key: Optional[tuple] = None
 
         layout = QtWidgets.QVBoxLayout(self)
 
@@ -1493,9 +1724,13 @@ class ViewTab(QtWidgets.QWidget):
         add_filter("Side", self.filter_inputs["side"], 0, 2)
 
         self.filter_inputs["row"] = QtWidgets.QLineEdit()
+        # Validators keep row/bin numeric at input time, so filter assembly
+        # can cast without re-checking every call.
+        self.filter_inputs["row"].setValidator(QtGui.QIntValidator(0, 10_000_000, self))
         add_filter("Row", self.filter_inputs["row"], 1, 2)
 
         self.filter_inputs["bin"] = QtWidgets.QLineEdit()
+        self.filter_inputs["bin"].setValidator(QtGui.QIntValidator(0, 10_000_000, self))
         add_filter("Bin", self.filter_inputs["bin"], 2, 2)
 
         self.filter_inputs["consumable"] = QtWidgets.QComboBox()
@@ -1552,6 +1787,13 @@ class ViewTab(QtWidgets.QWidget):
         self._filter_timer.setInterval(250)
         self._filter_timer.timeout.connect(self.refresh_table)
 
+        # Short coalescing timer for sort/page clicks: rapid Next clicks or
+        # sort toggles update state immediately but issue one query.
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self.refresh_table)
+
         self.search_input.textChanged.connect(lambda _: self._filter_timer.start())
         for key, widget in self.filter_inputs.items():
             if isinstance(widget, QtWidgets.QLineEdit):
@@ -1566,8 +1808,10 @@ class ViewTab(QtWidgets.QWidget):
         for key, widget in self.filter_inputs.items():
             if isinstance(widget, QtWidgets.QLineEdit):
                 val = widget.text().strip()
-                if key in ("row", "bin") and val.isdigit():
-                    filters[key] = int(val)
+                if key in ("row", "bin"):
+                    # The validator still lets Intermediate text like a lone
+                    # "+" through, so guard the cast.
+                    filters[key] = int(val) if val.isdigit() else ""
                 else:
                     filters[key] = val
             elif isinstance(widget, QtWidgets.QComboBox):
@@ -1597,44 +1841,95 @@ class ViewTab(QtWidgets.QWidget):
         self.refresh_table()
 
     def refresh_table(self) -> None:
-        filters = self._build_sql_filters()
+        # _build_sql_filters already folds the global search term in under
+        # "global"; the repo pops that key itself.
+        sql_filters = self._build_sql_filters()
         order_by, order_dir = self.current_sort
         if self.show_all_cb.isChecked():
-            limit = max(self.total or 1, int(self.page_size_spin.value()))
+            limit = max(self.total or 1, self.page_size)
             offset = 0
         else:
-            limit = int(self.page_size_spin.value())
+            limit = self.page_size
             offset = self.page * limit
 
-        # Build combined filters (global search spreads across textual columns)
-        sql_filters = {}
-        global_term = filters.pop("global", "")
-        if global_term:
-            sql_filters["global"] = global_term
-        sql_filters.update(filters)
-
-        rows, total = self.inventory_repo.list_inventory_view_filtered(
-            sql_filters,
-            order_by=order_by,
-            order_dir="DESC" if order_dir == QtCore.Qt.SortOrder.DescendingOrder else "ASC",
-            limit=limit,
-            offset=offset,
+
+        direction = "DESC" if order_dir == QtCore.Qt.SortOrder.DescendingOrder else "ASC"
+        filters_key = tuple(sorted(sql_filters.items()))
+        with_total = (
+            filters_key != self._cached_filters_key or self._cached_total is None
         )
+        self._pending_filters_key = filters_key
+        self._query_seq += 1
+        seq = self._query_seq
+        repo = self._reader()
+        if repo is self.inventory_repo:
+            # No separate reader connection available; query inline.
+            rows, total = repo.list_inventory_view_filtered(
+                sql_filters,
+                order_by=order_by,
+                order_dir=direction,
+                limit=limit,
+                offset=offset,
+                with_total=with_total,
+            )
+            self._on_rows_loaded(rows, total, seq)
+            return
+
+        def query():
+            return repo.list_inventory_view_filtered(
+                sql_filters,
+                order_by=order_by,
+                order_dir=direction,
+                limit=limit,
+                offset=offset,
+                with_total=with_total,
+            )
+
+        QtCore.QThreadPool.globalInstance().start(
+            _QueryJob(query, seq, self._query_signals)
+        )
+
+    def _reader(self) -> InventoryRepository:
+        if self._reader_repo is None:
+            row = self.inventory_repo.conn.execute("PRAGMA database_list").fetchone()
+            db_path = row[2] if row else ""
+            if not db_path:
+                # In-memory databases are invisible to other connections.
+                return self.inventory_repo
+            conn = sqlite3.connect(db_path, check_same_thread=False)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA foreign_keys = ON")
+            self._reader_repo = InventoryRepository(conn, self.inventory_repo.id_repo)
+        return self._reader_repo
+
+    def _on_rows_loaded(self, rows, total: int, seq: int) -> None:
+        if seq != self._query_seq:
+            return
+        if total < 0:
+            total = self._cached_total or 0
+        else:
+            self._cached_filters_key = self._pending_filters_key
+            self._cached_total = total
         self.total = total
         self.model.set_rows(rows)
         self._update_pagination_label()
 
+    def _on_load_failed(self, message: str, seq: int) -> None:
+        if seq != self._query_seq:
+            return
+        logger.warning("Inventory view load failed: %s", message)
+
     def _change_page(self, delta: int) -> None:
-        max_page = max(0, (self.total - 1) // int(self.page_size_spin.value()) if self.total else 0)
+        max_page = max(0, (self.total - 1) // self.page_size if self.total else 0)
         new_page = min(max(self.page + delta, 0), max_page)
         if new_page != self.page:
             self.page = new_page
-            self.refresh_table()
+            self._refresh_timer.start()
 
     def _change_page_size(self, value: int) -> None:
         self.page_size = value
         self.page = 0
-        self.refresh_table()
+        self._refresh_timer.start()
 
     def _update_pagination_label(self) -> None:
         if self.total == 0:
@@ -1643,7 +1938,7 @@ class ViewTab(QtWidgets.QWidget):
         if self.show_all_cb.isChecked():
             self.page_label.setText(f"All results ({self.total})")
         else:
-            total_pages = max(1, (self.total + int(self.page_size_spin.value()) - 1) // int(self.page_size_spin.value()))
+            total_pages = max(1, (self.total + self.page_size - 1) // self.page_size)
             self.page_label.setText(f"Page {self.page + 1} of {total_pages} (Total {self.total})")
 
     def _toggle_show_all(self, checked: bool) -> None:
@@ -1653,7 +1948,7 @@ class ViewTab(QtWidgets.QWidget):
         else:
             self.page_size_spin.setEnabled(True)
         self.page = 0
-        self.refresh_table()
+        self._refresh_timer.start()
 
     def _on_header_clicked(self, section: int) -> None:
         header = self.headers[section]
@@ -1664,7 +1959,7 @@ class ViewTab(QtWidgets.QWidget):
         else:
             order_dir = QtCore.Qt.SortOrder.AscendingOrder
         self.current_sort = (header, order_dir)
-        self.refresh_table()
+        self._refresh_timer.start()
 
     def _export_csv(self) -> None:
         path, _ = QtWidgets.QFileDialog.getSaveFileName(
@@ -1682,12 +1977,12 @@ class ViewTab(QtWidgets.QWidget):
             with open(path, "w", newline="", encoding="utf-8") as f:
                 writer = csv.writer(f)
                 writer.writerow(headers)
-                for row_idx in range(self.model.rowCount()):
-                    row_data = []
-                    for col_idx in range(len(headers)):
-                        index = self.model.index(row_idx, col_idx)
-                        row_data.append(self.model.data(index))
-                    writer.writerow(row_data)
+                # Read the row dicts directly; going through model.data()
+                # would build a QModelIndex and cross into Qt per cell.
+                writer.writerows(
+                    [row.get(h, "") for h in headers]
+                    for row in self.model._rows
+                )
             QtWidgets.QMessageBox.information(self, "Exported", f"CSV saved to {path}")
         except Exception as exc:  # pylint: disable=broad-except
             QtWidgets.QMessageBox.warning(self, "Export failed", str(exc))
@@ -1701,23 +1996,28 @@ class ViewTab(QtWidgets.QWidget):
         )
         if not path:
             return
+        from html import escape
+
         from PyQt6.QtPrintSupport import QPrinter
         from PyQt6.QtGui import QTextDocument
 
         headers = self.model.headers
-        html_rows = []
-        for row_idx in range(self.model.rowCount()):
-            cols = []
-            for col_idx in range(len(headers)):
-                index = self.model.index(row_idx, col_idx)
-                cols.append(f"<td>{self.model.data(index) or ''}</td>")
-            html_rows.append(f"<tr>{''.join(cols)}</tr>")
+        # Single-pass assembly from the row dicts: no QModelIndex per cell and
+        # no per-row list of <td> strings; escape() also keeps stray angle
+        # brackets in the data from being parsed as markup.
+        header_row = "".join(f"<th>{escape(h)}</th>" for h in headers)
+        body = "".join(
+            "<tr>"
+            + "".join(f"<td>{escape(str(row.get(h, '') or ''))}</td>" for h in headers)
+            + "</tr>"
+            for row in self.model._rows
+        )
         html = f"""
         <html><body>
         <h2>Inventory View</h2>
         <table border="1" cellspacing="0" cellpadding="3">
-          <tr>{''.join(f'<th>{h}</th>' for h in headers)}</tr>
-          {''.join(html_rows)}
+          <tr>{header_row}</tr>
+          {body}
         </table>
         </body></html>
         """
@@ -1741,6 +2041,7 @@ class AuditTab(QtWidgets.QWidget):
         self.location_repo = location_repo
         self.inventory_repo = inventory_repo
         self.audit_repo = audit_repo
+        self._observed_set: set = set()
         self._build_ui()
 
     def _build_ui(self) -> None:
@@ -1781,7 +2082,7 @@ class AuditTab(QtWidgets.QWidget):
         right_layout.addLayout(observed_controls)
 
         self.add_observed_btn.clicked.connect(self._add_observed)
-        self.clear_observed_btn.clicked.connect(self.observed_list.clear)
+        self.clear_observed_btn.clicked.connect(self._clear_observed)
         splitter.addWidget(right_widget)
         layout.addWidget(splitter)
 
@@ -1809,7 +2110,7 @@ class AuditTab(QtWidgets.QWidget):
             return
         meta = f"Location {location.location_id} | Vehicle: {location.vehicle_id or 'N/A'} | {location.side} row {location.row} bin {location.bin}"
         self.location_meta.setText(meta)
-        items = self.inventory_repo.list_inventory(location_id=location_id)
+        items = self.inventory_repo.iter_inventory(location_id=location_id)
         self.expected_model.set_rows([asdict(item) for item in items])
         self.results.clear()
 
@@ -1818,11 +2119,17 @@ class AuditTab(QtWidgets.QWidget):
         if not value:
             return
         self.observed_list.addItem(value)
+        self._observed_set.add(value)
         self.observed_input.clear()
 
+    def _clear_observed(self) -> None:
+        self.observed_list.clear()
+        self._observed_set.clear()
+
     def _compare(self) -> None:
-        expected_ids = {self.expected_model._rows[i].get("asset_id") for i in range(len(self.expected_model._rows))}  # type: ignore[attr-defined]
-        observed_ids = {self.observed_list.item(i).text() for i in range(self.observed_list.count())}
+        expected_ids = {row.get("asset_id") for row in self.expected_model._rows}  # type: ignore[attr-defined]
+        # Maintained alongside the list widget, so compare never walks it.
+        observed_ids = self._observed_set
         missing = sorted(expected_ids - observed_ids)
         extra = sorted(observed_ids - expected_ids)
         lines = [
@@ -1841,9 +2148,14 @@ class AuditTab(QtWidgets.QWidget):
 
 
 class VehiclesTab(QtWidgets.QWidget):
+    # Fleets up to this size load in full; beyond it the overview paginates
+    # so Qt never re-stringifies rows it will not paint.
+    PAGE_SIZE = 500
+
     def __init__(self, vehicle_repo: VehicleRepository):
         super().__init__()
         self.vehicle_repo = vehicle_repo
+        self.page = 0
         layout = QtWidgets.QVBoxLayout(self)
         headers = [
             "vehicle_id",
@@ -1864,11 +2176,47 @@ class VehiclesTab(QtWidgets.QWidget):
         self.table.setSortingEnabled(True)
         layout.addWidget(self.table)
 
+        pagination = QtWidgets.QHBoxLayout()
+        self.prev_btn = QtWidgets.QPushButton("Prev")
+        self.next_btn = QtWidgets.QPushButton("Next")
+        self.page_label = QtWidgets.QLabel("")
+        self.prev_btn.clicked.connect(lambda: self._change_page(-1))
+        self.next_btn.clicked.connect(lambda: self._change_page(1))
+        pagination.addWidget(self.prev_btn)
+        pagination.addWidget(self.page_label)
+        pagination.addWidget(self.next_btn)
+        pagination.addStretch()
+        self._pagination_widgets = (self.prev_btn, self.page_label, self.next_btn)
+        for widget in self._pagination_widgets:
+            widget.setVisible(False)
+        layout.addLayout(pagination)
+
         self.refresh_btn = QtWidgets.QPushButton("Refresh")
         self.refresh_btn.clicked.connect(self.refresh_table)
         layout.addWidget(self.refresh_btn)
         self.refresh_table()
 
     def refresh_table(self) -> None:
-        rows = self.vehicle_repo.overview_with_counts()
+        total = self.vehicle_repo.count_vehicles()
+        paginate = total > self.PAGE_SIZE
+        if paginate:
+            max_page = (total - 1) // self.PAGE_SIZE
+            self.page = min(self.page, max_page)
+            rows = self.vehicle_repo.overview_with_counts(
+                limit=self.PAGE_SIZE, offset=self.page * self.PAGE_SIZE
+            )
+            self.page_label.setText(
+                f"Page {self.page + 1} of {max_page + 1} (Total {total})"
+            )
+        else:
+            self.page = 0
+            rows = self.vehicle_repo.overview_with_counts()
+        for widget in self._pagination_widgets:
+            widget.setVisible(paginate)
         self.model.set_rows(rows)
+
+    def _change_page(self, delta: int) -> None:
+        new_page = max(0, self.page + delta)
+        if new_page != self.page:
+            self.page = new_page
+            self.refresh_table()
@@ -8,6 +8,15 @@ class DictTableModel(QtCore.QAbstractTableModel):
         super().__init__()
         self.headers = list(headers)
         self._rows: List[Dict[str, Any]] = rows or []
+        # Lazily built lowercase search text per row; see search_blob().
+        self._blobs: List[str | None] = [None] * len(self._rows)
+        # Column-oriented display strings, stringified once per cell instead
+        # of per paint. Kept in lockstep with _rows; all row mutations must go
+        # through set_rows/apply_delta.
+        self._cols: List[List[str]] = self._build_cols(self._rows)
+
+    def _build_cols(self, rows: List[Dict[str, Any]]) -> List[List[str]]:
+        return [[str(r.get(h, "")) for r in rows] for h in self.headers]
 
     def rowCount(self, parent: QtCore.QModelIndex | None = None) -> int:  # noqa: N802
         return len(self._rows)
@@ -18,10 +27,8 @@ class DictTableModel(QtCore.QAbstractTableModel):
     def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole) -> Any:  # noqa: N802
         if not index.isValid():
             return None
-        row = self._rows[index.row()]
-        key = self.headers[index.column()]
         if role == QtCore.Qt.ItemDataRole.DisplayRole:
-            return str(row.get(key, ""))
+            return self._cols[index.column()][index.row()]
         return None
 
     def headerData(  # noqa: N802
@@ -41,11 +48,96 @@ class DictTableModel(QtCore.QAbstractTableModel):
             | QtCore.Qt.ItemFlag.ItemIsSelectable
         )
 
+    def search_blob(self, row: int) -> str:
+        """
+        Lowercase concatenation of a row's values, cached for filtering.
+
+        Built on first use so refreshes do not pay for rows never searched.
+        """
+        blob = self._blobs[row]
+        if blob is None:
+            blob = " ".join(str(v) for v in self._rows[row].values()).lower()
+            self._blobs[row] = blob
+        return blob
+
     def set_rows(self, rows: List[Dict[str, Any]]) -> None:
         self.beginResetModel()
         self._rows = rows
+        self._blobs = [None] * len(rows)
+        self._cols = self._build_cols(rows)
         self.endResetModel()
 
+    def apply_delta(self, new_rows: List[Dict[str, Any]], key: str) -> None:
+        """
+        Update the model towards `new_rows`, emitting targeted remove/insert/
+        dataChanged signals instead of a full reset where possible.
+
+        Rows are matched by the `key` column. If the result would not line up
+        with `new_rows` (e.g. the surviving rows were reordered), falls back to
+        a plain `set_rows` reset.
+        """
+        if not self._rows:
+            self.set_rows(list(new_rows))
+            return
+        new_keys = [row.get(key) for row in new_rows]
+        new_key_set = set(new_keys)
+        last_col = len(self.headers) - 1
+
+        # Drop vanished rows bottom-up so pending indexes stay valid.
+        for i in range(len(self._rows) - 1, -1, -1):
+            if self._rows[i].get(key) not in new_key_set:
+                self.beginRemoveRows(QtCore.QModelIndex(), i, i)
+                del self._rows[i]
+                del self._blobs[i]
+                for col in self._cols:
+                    del col[i]
+                self.endRemoveRows()
+
+        # Insert new rows at their target positions.
+        existing = {row.get(key) for row in self._rows}
+        for pos, row in enumerate(new_rows):
+            if row.get(key) not in existing:
+                self.beginInsertRows(QtCore.QModelIndex(), pos, pos)
+                self._rows.insert(pos, row)
+                self._blobs.insert(pos, None)
+                for col, h in zip(self._cols, self.headers):
+                    col.insert(pos, str(row.get(h, "")))
+                self.endInsertRows()
+
+        if [row.get(key) for row in self._rows] != new_keys:
+            self.set_rows(list(new_rows))
+            return
+
+        # Same keys in the same order: emit dataChanged for edited rows only.
+        for i, (old_row, new_row) in enumerate(zip(self._rows, new_rows)):
+            if old_row != new_row:
+                self._rows[i] = new_row
+                self._blobs[i] = None
+                for col, h in zip(self._cols, self.headers):
+                    col[i] = str(new_row.get(h, ""))
+                self.dataChanged.emit(self.index(i, 0), self.index(i, last_col))
+
+
+class SearchFilterProxyModel(QtCore.QSortFilterProxyModel):
+    """
+    Sort/filter proxy that matches a lowercase needle against the source
+    model's cached per-row search blob, instead of letting Qt query data()
+    for every cell and case-fold each value per keystroke.
+    """
+
+    def __init__(self, parent: QtCore.QObject | None = None):
+        super().__init__(parent)
+        self._needle = ""
+
+    def setFilterFixedString(self, pattern: str) -> None:  # noqa: N802
+        self._needle = (pattern or "").lower()
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QtCore.QModelIndex) -> bool:  # noqa: N802
+        if not self._needle:
+            return True
+        return self._needle in self.sourceModel().search_blob(source_row)
+
 
 class VehicleTableModel(DictTableModel):
     def __init__(self):
@@ -1,31 +1,92 @@
 import logging
-import random
 import sqlite3
 from dataclasses import dataclass
-from typing import List, Optional, Sequence
+from typing import Iterator, List, Optional, Sequence
 
-from .db import iso_now
+from .db import iso_now, maybe_commit, transaction
 
 logger = logging.getLogger(__name__)
 
+# Filter/order keys accepted by list_inventory_view_filtered, mapped to their
+# qualified column. Module-level so the dict is built once, not per call.
+_VIEW_COLUMNS = {
+    "asset_id": "inv.asset_id",
+    "location_id": "inv.location_id",
+    "description": "inv.description",
+    "consumable": "inv.consumable",
+    "manufacturer": "inv.manufacturer",
+    "model": "inv.model",
+    "serial_number": "inv.serial_number",
+    "vehicle_name": "veh.vehicle_name",
+    "vehicle_type": "veh.vehicle_type",
+    "side": "loc.side",
+    "row": "loc.row",
+    "bin": "loc.bin",
+    "last_audited_at": "loc.last_audited_at",
+}
+
 
 class GlobalIdRepository:
+    """
+    Allocates IDs from a monotonic counter instead of random probing.
+
+    The old scheme drew random 8-digit integers and retried on collision,
+    which degrades sharply as the table fills (birthday bound). The counter
+    is seeded once from the table's maximum, so restarts continue where the
+    last run stopped and collisions only occur against a concurrent writer.
+    """
+
     def __init__(self, conn: sqlite3.Connection):
         self.conn = conn
+        # Next candidate ID; seeded lazily on first allocation.
+        self._next_id: Optional[int] = None
+
+    def _seed_counter(self) -> None:
+        if self._next_id is None:
+            row = self.conn.execute(
+                "SELECT COALESCE(MAX(CAST(id AS INTEGER)), 0) FROM GlobalId"
+            ).fetchone()
+            self._next_id = row[0] + 1
 
     def generate_global_id(self) -> str:
+        self._seed_counter()
         while True:
-            id_str = f"{random.randint(1, 99999999):08d}"
+            id_str = f"{self._next_id:08d}"
+            self._next_id += 1
             try:
                 self.conn.execute("INSERT INTO GlobalId (id) VALUES (?)", (id_str,))
-                self.conn.commit()
+                maybe_commit(self.conn)
                 return id_str
             except sqlite3.IntegrityError:
-                self.conn.rollback()
+                # Another writer took this value; the counter is already
+                # bumped, so try the next one. No rollback — the failed
+                # INSERT had no effect.
+                continue
+
+    def generate_global_ids(self, count: int) -> List[str]:
+        """
+        Reserve `count` sequential IDs with one executemany and one commit.
+        """
+        if count <= 0:
+            return []
+        while True:
+            self._seed_counter()
+            ids = [f"{n:08d}" for n in range(self._next_id, self._next_id + count)]
+            try:
+                with transaction(self.conn):
+                    self.conn.executemany(
+                        "INSERT INTO GlobalId (id) VALUES (?)", [(i,) for i in ids]
+                    )
+            except sqlite3.IntegrityError:
+                # A concurrent writer advanced past the counter; reseed from
+                # the table and take the next free range.
+                self._next_id = None
                 continue
+            self._next_id += count
+            return ids
 
 
-@dataclass
+@dataclass(slots=True)
 class Vehicle:
     vehicle_id: str
     vehicle_type: str
@@ -51,8 +112,10 @@ class VehicleRepository:
         vehicle_number: int,
         mileage: int = 0,
         last_service: int = 0,
+        now: Optional[str] = None,
     ) -> Vehicle:
-        now = iso_now()
+        # Batch callers pass one timestamp instead of formatting per row.
+        now = now or iso_now()
         vehicle_id = self.id_repo.generate_global_id()
         self.conn.execute(
             """
@@ -73,7 +136,7 @@ class VehicleRepository:
                 now,
             ),
         )
-        self.conn.commit()
+        maybe_commit(self.conn)
         logger.info("Created vehicle %s (%s)", vehicle_name, vehicle_id)
         return Vehicle(
             vehicle_id=vehicle_id,
@@ -87,8 +150,11 @@ class VehicleRepository:
             updated_at=now,
         )
 
-    def list_vehicles(self) -> List[Vehicle]:
-        rows = self.conn.execute(
+    def iter_vehicles(self) -> Iterator[Vehicle]:
+        """
+        Stream vehicles one at a time; list_vehicles materializes this.
+        """
+        cursor = self.conn.execute(
             """
             SELECT vehicle_id, vehicle_type, vehicle_name, vin,
                    vehicle_number, mileage, last_service,
@@ -96,8 +162,16 @@ class VehicleRepository:
             FROM Vehicle
             ORDER BY vehicle_name
             """
-        ).fetchall()
-        return [Vehicle(**dict(row)) for row in rows]
+        )
+        # Positional construction: the SELECT lists columns in field order,
+        # skipping the per-row dict build and keyword unpack. Plain tuples
+        # are also cheaper to fetch than sqlite3.Row wrappers.
+        cursor.row_factory = None
+        for row in cursor:
+            yield Vehicle(*row)
+
+    def list_vehicles(self) -> List[Vehicle]:
+        return list(self.iter_vehicles())
 
     def update_vehicle(
         self,
@@ -131,11 +205,26 @@ class VehicleRepository:
             f"UPDATE Vehicle SET {', '.join(fields)}, updated_at = ? WHERE vehicle_id = ?",
             params,
         )
-        self.conn.commit()
+        maybe_commit(self.conn)
 
     def delete_vehicle(self, vehicle_id: str) -> None:
         self.conn.execute("DELETE FROM Vehicle WHERE vehicle_id = ?", (vehicle_id,))
-        self.conn.commit()
+        maybe_commit(self.conn)
+
+    def find_by_number(self, vehicle_number: int) -> Optional[Vehicle]:
+        """
+        Single indexed probe by vehicle number, for existence checks.
+        """
+        row = self.conn.execute(
+            """
+            SELECT vehicle_id, vehicle_type, vehicle_name, vin,
+                   vehicle_number, mileage, last_service,
+                   created_at, updated_at
+            FROM Vehicle WHERE vehicle_number = ? LIMIT 1
+            """,
+            (vehicle_number,),
+        ).fetchone()
+        return Vehicle(**dict(row)) if row else None
 
     def get_vehicle(self, vehicle_id: str) -> Optional[Vehicle]:
         row = self.conn.execute(
@@ -149,9 +238,13 @@ class VehicleRepository:
         ).fetchone()
         return Vehicle(**dict(row)) if row else None
 
-    def overview_with_counts(self) -> List[dict]:
-        rows = self.conn.execute(
-            """
+    def count_vehicles(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM Vehicle").fetchone()[0]
+
+    def overview_with_counts(
+        self, *, limit: Optional[int] = None, offset: int = 0
+    ) -> List[dict]:
+        sql = """
             SELECT v.vehicle_id, v.vehicle_name, v.vehicle_type, v.vin,
                    v.vehicle_number, v.mileage, v.last_service,
                    v.created_at, v.updated_at,
@@ -162,11 +255,15 @@ class VehicleRepository:
             GROUP BY v.vehicle_id
             ORDER BY v.vehicle_name
             """
-        ).fetchall()
+        params: list = []
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params = [limit, offset]
+        rows = self.conn.execute(sql, params).fetchall()
         return [dict(row) for row in rows]
 
 
-@dataclass
+@dataclass(slots=True)
 class Location:
     location_id: str
     vehicle_id: Optional[str]
@@ -182,6 +279,9 @@ class LocationRepository:
     def __init__(self, conn: sqlite3.Connection, id_repo: GlobalIdRepository):
         self.conn = conn
         self.id_repo = id_repo
+        # Bumped on every write so cached read snapshots know when to refill.
+        self._version = 0
+        self._dicts_cache: Optional[tuple] = None
 
     def create_location(
         self,
@@ -189,8 +289,9 @@ class LocationRepository:
         row: int,
         bin: int,
         vehicle_id: Optional[str] = None,
+        now: Optional[str] = None,
     ) -> Location:
-        now = iso_now()
+        now = now or iso_now()
         location_id = self.id_repo.generate_global_id()
         self.conn.execute(
             """
@@ -201,7 +302,8 @@ class LocationRepository:
             """,
             (location_id, vehicle_id, side, row, bin, now, now, None),
         )
-        self.conn.commit()
+        maybe_commit(self.conn)
+        self._version += 1
         logger.info("Created location %s (vehicle %s)", location_id, vehicle_id or "N/A")
         return Location(
             location_id=location_id,
@@ -214,20 +316,99 @@ class LocationRepository:
             last_audited_at=None,
         )
 
-    def list_locations(self, vehicle_id: Optional[str] = None) -> List[Location]:
+    def ensure_location(
+        self,
+        side: str,
+        row: int,
+        bin: int,
+        vehicle_id: Optional[str] = None,
+        now: Optional[str] = None,
+    ) -> Location:
+        """
+        Return the location at (vehicle, side, row, bin), creating it if
+        missing — one INSERT .. ON CONFLICT DO NOTHING against the UNIQUE
+        constraint instead of a SELECT-then-INSERT round trip.
+
+        Note SQLite treats NULLs as distinct in UNIQUE constraints, so
+        unassigned locations (vehicle_id None) are never deduplicated here.
+        """
+        now = now or iso_now()
+        # The reserved ID is wasted when the location already exists; that
+        # just consumes one value from the pool.
+        location_id = self.id_repo.generate_global_id()
+        cur = self.conn.execute(
+            """
+            INSERT INTO Location (
+                location_id, vehicle_id, side, row, bin,
+                created_at, updated_at, last_audited_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (vehicle_id, side, row, bin) DO NOTHING
+            """,
+            (location_id, vehicle_id, side, row, bin, now, now, None),
+        )
+        maybe_commit(self.conn)
+        if cur.rowcount:
+            self._version += 1
+            logger.info(
+                "Created location %s (vehicle %s)", location_id, vehicle_id or "N/A"
+            )
+            return Location(
+                location_id=location_id,
+                vehicle_id=vehicle_id,
+                side=side,
+                row=row,
+                bin=bin,
+                created_at=now,
+                updated_at=now,
+                last_audited_at=None,
+            )
+        existing = self.conn.execute(
+            "SELECT * FROM Location WHERE vehicle_id IS ? AND side = ? AND row = ? AND bin = ?",
+            (vehicle_id, side, row, bin),
+        ).fetchone()
+        return Location(**dict(existing))
+
+    def iter_locations(self, vehicle_id: Optional[str] = None) -> Iterator[Location]:
+        """
+        Stream locations one at a time; list_locations materializes this.
+        """
+        columns = (
+            "location_id, vehicle_id, side, row, bin, "
+            "created_at, updated_at, last_audited_at"
+        )
         if vehicle_id:
-            rows = self.conn.execute(
-                """
-                SELECT * FROM Location
+            cursor = self.conn.execute(
+                f"""
+                SELECT {columns} FROM Location
                 WHERE vehicle_id = ?
                 ORDER BY side, row, bin
                 """,
                 (vehicle_id,),
-            ).fetchall()
+            )
         else:
-            rows = self.conn.execute(
-                "SELECT * FROM Location ORDER BY vehicle_id, side, row, bin"
-            ).fetchall()
+            cursor = self.conn.execute(
+                f"SELECT {columns} FROM Location ORDER BY vehicle_id, side, row, bin"
+            )
+        # Columns are listed in field order so rows construct positionally
+        # from plain tuples, skipping the sqlite3.Row wrapper per row.
+        cursor.row_factory = None
+        for row in cursor:
+            yield Location(*row)
+
+    def list_locations(self, vehicle_id: Optional[str] = None) -> List[Location]:
+        return list(self.iter_locations(vehicle_id=vehicle_id))
+
+    def search_locations(self, term: str, limit: int = 500) -> List[Location]:
+        like = f"%{term}%"
+        rows = self.conn.execute(
+            """
+            SELECT * FROM Location
+            WHERE location_id LIKE ? OR vehicle_id LIKE ? OR side LIKE ?
+            ORDER BY vehicle_id, side, row, bin
+            LIMIT ?
+            """,
+            (like, like, like, limit),
+        ).fetchall()
         return [Location(**dict(row)) for row in rows]
 
     def get_location(self, location_id: str) -> Optional[Location]:
@@ -266,14 +447,29 @@ class LocationRepository:
             f"UPDATE Location SET {', '.join(fields)}, updated_at = ? WHERE location_id = ?",
             params,
         )
-        self.conn.commit()
+        maybe_commit(self.conn)
+        self._version += 1
 
     def delete_location(self, location_id: str) -> None:
         self.conn.execute("DELETE FROM Location WHERE location_id = ?", (location_id,))
-        self.conn.commit()
+        maybe_commit(self.conn)
+        self._version += 1
+
+    def list_locations_dicts(self) -> List[dict]:
+        """
+        Plain-dict snapshot of all locations, cached until the next write.
+        """
+        if self._dicts_cache is not None and self._dicts_cache[0] == self._version:
+            return self._dicts_cache[1]
+        rows = self.conn.execute(
+            "SELECT * FROM Location ORDER BY vehicle_id, side, row, bin"
+        ).fetchall()
+        dicts = [dict(row) for row in rows]
+        self._dicts_cache = (self._version, dicts)
+        return dicts
 
 
-@dataclass
+@dataclass(slots=True)
 class InventoryItem:
     asset_id: str
     description: str
@@ -287,6 +483,16 @@ class InventoryItem:
 
 
 class InventoryRepository:
+    # Shared by the single and bulk insert paths so both bind the same
+    # prepared statement from sqlite3's statement cache.
+    _INSERT_SQL = """
+        INSERT INTO Inventory (
+            asset_id, description, location_id, consumable,
+            manufacturer, model, serial_number,
+            created_at, updated_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
     def __init__(self, conn: sqlite3.Connection, id_repo: GlobalIdRepository):
         self.conn = conn
         self.id_repo = id_repo
@@ -299,17 +505,12 @@ class InventoryRepository:
         manufacturer: Optional[str] = None,
         model: Optional[str] = None,
         serial_number: Optional[str] = None,
+        now: Optional[str] = None,
     ) -> InventoryItem:
-        now = iso_now()
+        now = now or iso_now()
         asset_id = self.id_repo.generate_global_id()
         self.conn.execute(
-            """
-            INSERT INTO Inventory (
-                asset_id, description, location_id, consumable,
-                manufacturer, model, serial_number,
-                created_at, updated_at
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
+            self._INSERT_SQL,
             (
                 asset_id,
                 description,
@@ -322,7 +523,7 @@ class InventoryRepository:
                 now,
             ),
         )
-        self.conn.commit()
+        maybe_commit(self.conn)
         logger.info("Created inventory item %s (%s)", description, asset_id)
         return InventoryItem(
             asset_id=asset_id,
@@ -336,6 +537,39 @@ class InventoryRepository:
             updated_at=now,
         )
 
+    def create_inventory_many(
+        self, rows: List[dict], now: Optional[str] = None
+    ) -> List[str]:
+        """
+        Insert many inventory rows in one transaction.
+
+        Each dict takes the create_inventory keyword arguments. IDs are
+        reserved in a batch and the rows land via one executemany inside a
+        single commit, instead of an insert + fsync per row.
+        """
+        if not rows:
+            return []
+        now = now or iso_now()
+        asset_ids = self.id_repo.generate_global_ids(len(rows))
+        params = [
+            (
+                asset_id,
+                row["description"],
+                row["location_id"],
+                1 if row.get("consumable") else 0,
+                row.get("manufacturer"),
+                row.get("model"),
+                row.get("serial_number"),
+                now,
+                now,
+            )
+            for asset_id, row in zip(asset_ids, rows)
+        ]
+        with transaction(self.conn):
+            self.conn.executemany(self._INSERT_SQL, params)
+        logger.info("Created %d inventory items in bulk", len(params))
+        return asset_ids
+
     def update_inventory(
         self,
         asset_id: str,
@@ -375,23 +609,61 @@ class InventoryRepository:
             f"UPDATE Inventory SET {', '.join(fields)}, updated_at = ? WHERE asset_id = ?",
             params,
         )
-        self.conn.commit()
+        maybe_commit(self.conn)
 
     def delete_inventory(self, asset_id: str) -> None:
         self.conn.execute("DELETE FROM Inventory WHERE asset_id = ?", (asset_id,))
-        self.conn.commit()
+        maybe_commit(self.conn)
 
-    def list_inventory(self, location_id: Optional[str] = None) -> List[InventoryItem]:
+    def iter_inventory(
+        self, location_id: Optional[str] = None
+    ) -> Iterator[InventoryItem]:
+        """
+        Stream inventory items one at a time; list_inventory materializes
+        this. Callers that only scan (completers, seeding snapshots) peak at
+        one row of Python objects instead of the whole table twice.
+        """
+        columns = (
+            "asset_id, description, location_id, consumable, "
+            "manufacturer, model, serial_number, created_at, updated_at"
+        )
         if location_id:
-            rows = self.conn.execute(
-                "SELECT * FROM Inventory WHERE location_id = ? ORDER BY description",
+            cursor = self.conn.execute(
+                f"SELECT {columns} FROM Inventory WHERE location_id = ? ORDER BY description",
                 (location_id,),
-            ).fetchall()
+            )
         else:
-            rows = self.conn.execute(
-                "SELECT * FROM Inventory ORDER BY description"
-            ).fetchall()
-        return [InventoryItem(**dict(row)) for row in rows]
+            cursor = self.conn.execute(
+                f"SELECT {columns} FROM Inventory ORDER BY description"
+            )
+        # Columns are listed in field order so rows construct positionally
+        # from plain tuples, skipping the sqlite3.Row wrapper per row.
+        cursor.row_factory = None
+        for row in cursor:
+            yield InventoryItem(*row)
+
+    def list_inventory(self, location_id: Optional[str] = None) -> List[InventoryItem]:
+        return list(self.iter_inventory(location_id=location_id))
+
+    def find(
+        self,
+        location_id: str,
+        description: str,
+        serial_number: Optional[str] = None,
+    ) -> Optional[InventoryItem]:
+        """
+        Single indexed probe by (location, description, serial), for
+        existence checks. IS matches NULL serials too.
+        """
+        row = self.conn.execute(
+            """
+            SELECT * FROM Inventory
+            WHERE location_id = ? AND description = ? AND serial_number IS ?
+            LIMIT 1
+            """,
+            (location_id, description, serial_number),
+        ).fetchone()
+        return InventoryItem(**dict(row)) if row else None
 
     def get_inventory(self, asset_id: str) -> Optional[InventoryItem]:
         row = self.conn.execute(
@@ -418,16 +690,30 @@ class InventoryRepository:
         where_clause = f"WHERE {' AND '.join(where)}" if where else ""
         order_dir_sql = "DESC" if order_dir.upper() == "DESC" else "ASC"
         order_col = order_by if order_by in {"description", "asset_id", "location_id"} else "description"
-        count_sql = f"SELECT COUNT(*) FROM Inventory {where_clause}"
-        total = self.conn.execute(count_sql, params).fetchone()[0]
+        columns = (
+            "asset_id, description, location_id, consumable, "
+            "manufacturer, model, serial_number, created_at, updated_at"
+        )
+        # COUNT(*) OVER () carries the filtered total on every row, so the
+        # WHERE scan runs once instead of once for COUNT and once for data.
         data_sql = f"""
-            SELECT * FROM Inventory
+            SELECT {columns}, COUNT(*) OVER () AS total_rows FROM Inventory
             {where_clause}
             ORDER BY {order_col} {order_dir_sql}
             LIMIT ? OFFSET ?
         """
-        rows = self.conn.execute(data_sql, params + [limit, offset]).fetchall()
-        return [InventoryItem(**dict(row)) for row in rows], total
+        cursor = self.conn.execute(data_sql, params + [limit, offset])
+        # Construction is positional, so skip the sqlite3.Row wrapper.
+        cursor.row_factory = None
+        rows = cursor.fetchall()
+        if rows:
+            total = rows[0][-1]
+        else:
+            # Page past the end: no row carries the window count.
+            total = self.conn.execute(
+                f"SELECT COUNT(*) FROM Inventory {where_clause}", params
+            ).fetchone()[0]
+        return [InventoryItem(*row[:-1]) for row in rows], total
 
     def list_inventory_view(self) -> List[dict]:
         rows = self.conn.execute(
@@ -452,40 +738,31 @@ class InventoryRepository:
         order_dir: str = "ASC",
         limit: int = 100,
         offset: int = 0,
+        with_total: bool = True,
     ) -> tuple[list[dict], int]:
-        columns = {
-            "asset_id": "inv.asset_id",
-            "location_id": "inv.location_id",
-            "description": "inv.description",
-            "consumable": "inv.consumable",
-            "manufacturer": "inv.manufacturer",
-            "model": "inv.model",
-            "serial_number": "inv.serial_number",
-            "vehicle_name": "veh.vehicle_name",
-            "vehicle_type": "veh.vehicle_type",
-            "side": "loc.side",
-            "row": "loc.row",
-            "bin": "loc.bin",
-            "last_audited_at": "loc.last_audited_at",
-        }
         where = []
         params: list = []
-        global_term = filters.pop("global", None) or filters.pop("__global__", None)
+        # .get, not .pop: the filters dict belongs to the caller.
+        global_term = filters.get("global") or filters.get("__global__")
         if global_term:
-            like_value = f"%{global_term}%"
-            where.append(
-                "("
-                "inv.asset_id LIKE ? OR inv.location_id LIKE ? OR inv.description LIKE ? OR "
-                "inv.manufacturer LIKE ? OR inv.model LIKE ? OR inv.serial_number LIKE ? OR "
-                "veh.vehicle_name LIKE ? OR veh.vehicle_type LIKE ? OR loc.side LIKE ?"
-                ")"
+            # The global box used to LIKE against nine columns, scanning the
+            # whole join per keystroke. The FTS index answers the same search
+            # in O(hits); each token is quoted so user input cannot inject
+            # MATCH syntax, with * for prefix matching.
+            match = " ".join(
+                f'"{token}"*' for token in str(global_term).replace('"', " ").split()
             )
-            params.extend([like_value] * 9)
+            if match:
+                where.append(
+                    "inv.rowid IN (SELECT rowid FROM InventorySearch"
+                    " WHERE InventorySearch MATCH ?)"
+                )
+                params.append(match)
 
         for key, value in filters.items():
             if not value:
                 continue
-            col = columns.get(key)
+            col = _VIEW_COLUMNS.get(key)
             if not col:
                 continue
             if key in ("row", "bin"):
@@ -498,22 +775,20 @@ class InventoryRepository:
                 where.append(f"{col} LIKE ?")
                 params.append(f"%{value}%")
         where_clause = f"WHERE {' AND '.join(where)}" if where else ""
-        order_col = columns.get(order_by, "inv.description")
+        order_col = _VIEW_COLUMNS.get(order_by, "inv.description")
         order_dir_sql = "DESC" if order_dir.upper() == "DESC" else "ASC"
 
-        count_sql = f"""
-            SELECT COUNT(*) FROM Inventory AS inv
-            JOIN Location AS loc ON inv.location_id = loc.location_id
-            LEFT JOIN Vehicle AS veh ON loc.vehicle_id = veh.vehicle_id
-            {where_clause}
-        """
-        total = self.conn.execute(count_sql, params).fetchone()[0]
-
+        # The total only changes with the filter set, so pagination-only
+        # callers pass with_total=False and reuse their cached count. When it
+        # is wanted, COUNT(*) OVER () rides along on the data rows so the
+        # three-way join runs once instead of twice.
+        total = -1
+        total_col = ", COUNT(*) OVER () AS total_rows" if with_total else ""
         data_sql = f"""
             SELECT inv.asset_id, inv.location_id, inv.description, inv.consumable,
                    inv.manufacturer, inv.model, inv.serial_number,
                    veh.vehicle_name, veh.vehicle_type,
-                   loc.side, loc.row, loc.bin, loc.last_audited_at
+                   loc.side, loc.row, loc.bin, loc.last_audited_at{total_col}
             FROM Inventory AS inv
             JOIN Location AS loc ON inv.location_id = loc.location_id
             LEFT JOIN Vehicle AS veh ON loc.vehicle_id = veh.vehicle_id
@@ -522,7 +797,21 @@ class InventoryRepository:
             LIMIT ? OFFSET ?
         """
         rows = self.conn.execute(data_sql, params + [limit, offset]).fetchall()
-        return [dict(row) for row in rows], total
+        dicts = [dict(row) for row in rows]
+        if with_total:
+            if dicts:
+                for d in dicts:
+                    total = d.pop("total_rows")
+            else:
+                # Page past the end: no row carries the window count.
+                count_sql = f"""
+                    SELECT COUNT(*) FROM Inventory AS inv
+                    JOIN Location AS loc ON inv.location_id = loc.location_id
+                    LEFT JOIN Vehicle AS veh ON loc.vehicle_id = veh.vehicle_id
+                    {where_clause}
+                """
+                total = self.conn.execute(count_sql, params).fetchone()[0]
+        return dicts, total
 
 
 class AuditRepository:
@@ -550,7 +839,7 @@ class AuditRepository:
             """,
             (asset_id, from_location_id, to_location_id, action, notes, timestamp, user),
         )
-        self.conn.commit()
+        maybe_commit(self.conn)
         return cursor.lastrowid
 
     def list_audits_for_asset(self, asset_id: str) -> Sequence[sqlite3.Row]:
@@ -10,7 +10,7 @@ import random
 from pathlib import Path
 
 from .config import load_config
-from .db import DatabaseManager
+from .db import DatabaseManager, iso_now
 from .repositories import (
     GlobalIdRepository,
     InventoryRepository,
@@ -19,57 +19,63 @@ from .repositories import (
 )
 
 
-def _ensure_vehicle(repo: VehicleRepository, *, vehicle_number: int, **kwargs):
-    existing = next(
-        (v for v in repo.list_vehicles() if v.vehicle_number == vehicle_number), None
-    )
-    return existing or repo.create_vehicle(vehicle_number=vehicle_number, **kwargs)
+# The _ensure_* helpers memoize rows in per-run dicts; a miss probes the
+# database with one indexed LIMIT 1 lookup (or the location upsert) before
+# creating, so nothing ever lists or scans a whole table.
+
+
+def _ensure_vehicle(repo: VehicleRepository, cache: dict, *, vehicle_number: int, **kwargs):
+    vehicle = cache.get(vehicle_number)
+    if vehicle is None:
+        vehicle = repo.find_by_number(vehicle_number) or repo.create_vehicle(
+            vehicle_number=vehicle_number, **kwargs
+        )
+        cache[vehicle_number] = vehicle
+    return vehicle
 
 
 def _ensure_location(
     repo: LocationRepository,
+    cache: dict,
     *,
     vehicle_id: str | None,
     side: str,
     row: int,
     bin: int,
+    now: str | None = None,
 ):
-    for loc in repo.list_locations(vehicle_id=vehicle_id):
-        if (
-            loc.vehicle_id == vehicle_id
-            and loc.side == side
-            and loc.row == row
-            and loc.bin == bin
-        ):
-            return loc
-    return repo.create_location(
-        vehicle_id=vehicle_id, side=side, row=row, bin=bin
-    )
+    key = (vehicle_id, side, row, bin)
+    location = cache.get(key)
+    if location is None:
+        # ensure_location is a single upsert statement, so a cache miss does
+        # not imply the row is absent from the database.
+        location = repo.ensure_location(
+            vehicle_id=vehicle_id, side=side, row=row, bin=bin, now=now
+        )
+        cache[key] = location
+    return location
 
 
 def _ensure_inventory(
     repo: InventoryRepository,
+    cache: dict,
     *,
     description: str,
     location_id: str,
     serial_number: str | None = None,
     **kwargs,
 ):
-    existing = next(
-        (
-            item
-            for item in repo.list_inventory(location_id=location_id)
-            if item.description == description
-            and item.serial_number == serial_number
-        ),
-        None,
-    )
-    return existing or repo.create_inventory(
-        description=description,
-        location_id=location_id,
-        serial_number=serial_number,
-        **kwargs,
-    )
+    key = (location_id, description, serial_number)
+    item = cache.get(key)
+    if item is None:
+        item = repo.find(location_id, description, serial_number) or repo.create_inventory(
+            description=description,
+            location_id=location_id,
+            serial_number=serial_number,
+            **kwargs,
+        )
+        cache[key] = item
+    return item
 
 
 def seed_demo(config_path: Path = Path("config.yaml"), items: int = 50) -> None:
@@ -80,89 +86,134 @@ def seed_demo(config_path: Path = Path("config.yaml"), items: int = 50) -> None:
     location_repo = LocationRepository(db.connection, id_repo)
     inventory_repo = InventoryRepository(db.connection, id_repo)
 
-    # Vehicles
-    truck = _ensure_vehicle(
-        vehicle_repo,
-        vehicle_number=101,
-        vehicle_type="Truck",
-        vehicle_name="Truck T-100",
-        vin="VINTRUCK123",
-        mileage=12500,
-        last_service=7800,
-    )
-    trailer = _ensure_vehicle(
-        vehicle_repo,
-        vehicle_number=201,
-        vehicle_type="Trailer",
-        vehicle_name="Trailer TR-200",
-        vin="VINTRAILER456",
-        mileage=4200,
-        last_service=1500,
-    )
+    # One timestamp for the whole run; every created row shares it.
+    seed_now = iso_now()
 
-    # Locations
-    truck_left_1 = _ensure_location(
-        location_repo, vehicle_id=truck.vehicle_id, side="Left", row=1, bin=1
-    )
-    truck_right_1 = _ensure_location(
-        location_repo, vehicle_id=truck.vehicle_id, side="Right", row=1, bin=1
-    )
-    truck_left_2 = _ensure_location(
-        location_repo, vehicle_id=truck.vehicle_id, side="Left", row=2, bin=2
-    )
-    trailer_front_1 = _ensure_location(
-        location_repo, vehicle_id=trailer.vehicle_id, side="Front", row=1, bin=1
-    )
+    # Per-run memo dicts for the _ensure_* helpers; misses fall through to
+    # single indexed probes rather than snapshotting whole tables up front.
+    vehicles: dict = {}
+    locations: dict = {}
+    items_cache: dict = {}
 
-    # Inventory
-    _ensure_inventory(
-        inventory_repo,
-        description="Impact Wrench",
-        manufacturer="Makita",
-        model="XWT08Z",
-        serial_number="IMPACT-001",
-        location_id=truck_left_1.location_id,
-        consumable=False,
-    )
-    _ensure_inventory(
-        inventory_repo,
-        description="Oil Filter",
-        manufacturer="WIX",
-        model="51348",
-        serial_number=None,
-        location_id=truck_right_1.location_id,
-        consumable=True,
-    )
-    _ensure_inventory(
-        inventory_repo,
-        description="Hydraulic Jack",
-        manufacturer="Torin",
-        model="T83006",
-        serial_number="JACK-099",
-        location_id=truck_left_2.location_id,
-        consumable=False,
-    )
-    _ensure_inventory(
-        inventory_repo,
-        description="Spare Tire",
-        manufacturer="Goodyear",
-        model="Wrangler",
-        serial_number="TIRE-SPARE-01",
-        location_id=trailer_front_1.location_id,
-        consumable=False,
-    )
-    _ensure_inventory(
-        inventory_repo,
-        description="Ratchet Straps (Pack of 4)",
-        manufacturer="Erickson",
-        model="34410",
-        serial_number=None,
-        location_id=trailer_front_1.location_id,
-        consumable=True,
-    )
+    # Seed data is throwaway, so trade durability for speed while it runs.
+    # A separate bulk connection with synchronous=OFF (the usual advice)
+    # would just block on the seed transaction's write lock; relaxing the
+    # pragma on the one connection and restoring it after has the same
+    # effect without the contention.
+    db.connection.execute("PRAGMA synchronous = OFF")
+    try:
+        # One transaction for the whole seed: every repository write below
+        # joins it, so the database is fsynced once instead of per row.
+        with db.transaction():
+            # Vehicles
+            truck = _ensure_vehicle(
+                vehicle_repo,
+                vehicles,
+                vehicle_number=101,
+                now=seed_now,
+                vehicle_type="Truck",
+                vehicle_name="Truck T-100",
+                vin="VINTRUCK123",
+                mileage=12500,
+                last_service=7800,
+            )
+            trailer = _ensure_vehicle(
+                vehicle_repo,
+                vehicles,
+                vehicle_number=201,
+                now=seed_now,
+                vehicle_type="Trailer",
+                vehicle_name="Trailer TR-200",
+                vin="VINTRAILER456",
+                mileage=4200,
+                last_service=1500,
+            )
+
+            # Locations
+            truck_left_1 = _ensure_location(
+                location_repo, locations, now=seed_now, vehicle_id=truck.vehicle_id, side="Left", row=1, bin=1
+            )
+            truck_right_1 = _ensure_location(
+                location_repo, locations, now=seed_now, vehicle_id=truck.vehicle_id, side="Right", row=1, bin=1
+            )
+            truck_left_2 = _ensure_location(
+                location_repo, locations, now=seed_now, vehicle_id=truck.vehicle_id, side="Left", row=2, bin=2
+            )
+            trailer_front_1 = _ensure_location(
+                location_repo, locations, now=seed_now, vehicle_id=trailer.vehicle_id, side="Front", row=1, bin=1
+            )
 
-    # Bulk inventory for load testing
-    _bulk_inventory(inventory_repo, [truck, trailer], location_repo, count=items)
+            # Inventory
+            _ensure_inventory(
+                inventory_repo,
+                items_cache,
+                description="Impact Wrench",
+                manufacturer="Makita",
+                model="XWT08Z",
+                serial_number="IMPACT-001",
+                location_id=truck_left_1.location_id,
+                consumable=False,
+                now=seed_now,
+            )
+            _ensure_inventory(
+                inventory_repo,
+                items_cache,
+                description="Oil Filter",
+                manufacturer="WIX",
+                model="51348",
+                serial_number=None,
+                location_id=truck_right_1.location_id,
+                consumable=True,
+                now=seed_now,
+            )
+            _ensure_inventory(
+                inventory_repo,
+                items_cache,
+                description="Hydraulic Jack",
+                manufacturer="Torin",
+                model="T83006",
+                serial_number="JACK-099",
+                location_id=truck_left_2.location_id,
+                consumable=False,
+                now=seed_now,
+            )
+            _ensure_inventory(
+                inventory_repo,
+                items_cache,
+                description="Spare Tire",
+                manufacturer="Goodyear",
+                model="Wrangler",
+                serial_number="TIRE-SPARE-01",
+                location_id=trailer_front_1.location_id,
+                consumable=False,
+                now=seed_now,
+            )
+            _ensure_inventory(
+                inventory_repo,
+                items_cache,
+                description="Ratchet Straps (Pack of 4)",
+                manufacturer="Erickson",
+                model="34410",
+                serial_number=None,
+                location_id=trailer_front_1.location_id,
+                consumable=True,
+                now=seed_now,
+            )
+
+            # Bulk inventory for load testing
+            _bulk_inventory(
+                inventory_repo,
+                [truck, trailer],
+                location_repo,
+                locations,
+                count=items,
+                now=seed_now,
+            )
+
+    finally:
+        db.connection.execute(
+            f"PRAGMA synchronous = {config.database.synchronous}"
+        )
 
     print(f"Demo data inserted (approx {items} inventory rows).")
     db.close()
@@ -172,8 +223,10 @@ def _bulk_inventory(
     inventory_repo: InventoryRepository,
     vehicles,
     location_repo: LocationRepository,
+    locations: dict,
     *,
     count: int,
+    now: str | None = None,
 ) -> None:
     descriptions = [
         "Impact Wrench",
@@ -203,38 +256,46 @@ def _bulk_inventory(
     # Ensure a handful of locations for each vehicle
     vehicle_locations = []
     for vehicle in vehicles:
-        locs = location_repo.list_locations(vehicle_id=vehicle.vehicle_id)
-        if len(locs) < 6:
-            for side in ["Left", "Right", "Front", "Rear"]:
-                for row in range(1, 3):
-                    locs.append(
-                        _ensure_location(
-                            location_repo,
-                            vehicle_id=vehicle.vehicle_id,
-                            side=side,
-                            row=row,
-                            bin=row,
-                        )
-                    )
-        vehicle_locations.extend(locs)
-
-    for i in range(count):
-        desc = random.choice(descriptions)
-        manufacturer = random.choice(manufacturers)
-        model = random.choice(models)
-        serial = f"{desc[:3].upper()}-{i:05d}"
-        location = random.choice(vehicle_locations)
-        consumable = bool(random.getrandbits(1))
-        _ensure_inventory(
-            inventory_repo,
-            description=desc,
-            manufacturer=manufacturer,
-            model=model,
-            serial_number=serial,
-            location_id=location.location_id,
-            consumable=consumable,
+        for side in ["Left", "Right", "Front", "Rear"]:
+            for row in range(1, 3):
+                _ensure_location(
+                    location_repo,
+                    locations,
+                    now=now,
+                    vehicle_id=vehicle.vehicle_id,
+                    side=side,
+                    row=row,
+                    bin=row,
+                )
+        vehicle_locations.extend(
+            loc for (vid, _, _, _), loc in locations.items()
+            if vid == vehicle.vehicle_id
         )
 
+    # Serial numbers are unique per index, so the per-row existence check of
+    # _ensure_inventory is unnecessary here; one bulk insert replaces `count`
+    # individual INSERT + commit round trips. Sampling each column with one
+    # random.choices call replaces four random.* calls per row.
+    descs = random.choices(descriptions, k=count)
+    mans = random.choices(manufacturers, k=count)
+    mods = random.choices(models, k=count)
+    locs = random.choices(vehicle_locations, k=count)
+    flags = random.choices((False, True), k=count)
+    rows = [
+        {
+            "description": desc,
+            "manufacturer": manufacturer,
+            "model": model,
+            "serial_number": f"{desc[:3].upper()}-{i:05d}",
+            "location_id": location.location_id,
+            "consumable": flag,
+        }
+        for i, (desc, manufacturer, model, location, flag) in enumerate(
+            zip(descs, mans, mods, locs, flags)
+        )
+    ]
+    inventory_repo.create_inventory_many(rows, now=now)
+
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Seed inventory demo data.")